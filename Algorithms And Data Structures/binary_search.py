@@ -5,6 +5,18 @@ Name:       Binary Search
 """
 
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+SEARCH_MODES = ("exact", "lower_bound", "upper_bound")
+
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+
 def binary_search(search_list, target):
     n = len(search_list)
     low = 0
@@ -39,3 +51,165 @@ def binary_search_recursive(search_list, target, low, high):
             return binary_search_recursive(search_list, target, low, high)
     else:
         return -1
+
+
+def lower_bound(search_list, target, low=0, high=None):
+    # First index in search_list[low:high] whose value is not less than target
+    # Returns high when every value is less than target
+    if high is None:
+        high = len(search_list)
+
+    while low < high:
+        mid = low + (high - low) // 2
+        if search_list[mid] < target:
+            low = mid + 1
+        else:
+            high = mid
+
+    return low
+
+
+def upper_bound(search_list, target, low=0, high=None):
+    # First index in search_list[low:high] whose value is greater than target
+    # Returns high when no value is greater than target
+    if high is None:
+        high = len(search_list)
+
+    while low < high:
+        mid = low + (high - low) // 2
+        if target < search_list[mid]:
+            high = mid
+        else:
+            low = mid + 1
+
+    return low
+
+
+def gallop(search_list, target, low, high, upper=False):
+    # lower_bound or upper_bound in search_list[low:high], probing forward from low
+    # at distances 1, 2, 4, ... first, so a bound near low costs O(log(distance))
+    step = 1
+    while low + step - 1 < high:
+        val = search_list[low + step - 1]
+        if val < target or (upper and not target < val):
+            low = low + step
+            step = step * 2
+        else:
+            high = low + step - 1
+            break
+
+    if upper:
+        return upper_bound(search_list, target, low, high)
+    return lower_bound(search_list, target, low, high)
+
+
+def exact_array(values):
+    # values as a 1-d numeric NumPy array, or None if converting could change them
+    # The type scan stops at the first str or tuple, so those lists are never converted
+    if isinstance(values, np.ndarray):
+        if values.ndim == 1 and values.dtype.kind in "iuf":
+            return values
+        return None
+
+    if all(type(val) is int for val in values):
+        if values and (min(values) < INT64_MIN or max(values) > INT64_MAX):
+            return None
+        return np.array(values, dtype=np.int64)
+
+    if all(type(val) is float for val in values):
+        return np.array(values, dtype=np.float64)
+
+    # Integers mixed with floats would be rounded to float64
+    return None
+
+
+def search_many_numpy(sorted_array, target_array, mode="exact"):
+    """
+    A function that searches a sorted NumPy array for every target at once
+    Arguments:
+        sorted_array: A 1-d NumPy array sorted in ascending order
+        target_array: A 1-d NumPy array of targets, in any order
+        mode: A string, one of "exact", "lower_bound" or "upper_bound"
+    Time complexity:
+        O(m*log(n)), for m targets, with the bisection vectorised by
+        np.searchsorted.
+    Space complexity:
+        O(m)
+    Return: A NumPy array of indices
+    """
+
+    positions = np.searchsorted(sorted_array, target_array, side="right" if mode == "upper_bound" else "left")
+    if mode != "exact":
+        return positions
+
+    n = sorted_array.size
+    if n == 0:
+        return np.full(target_array.shape, -1, dtype=np.intp)
+
+    # A lower bound is a hit only if it holds the target
+    found = (positions < n) & (sorted_array[np.minimum(positions, n - 1)] == target_array)
+    return np.where(found, positions, -1)
+
+
+def search_many(sorted_list, targets, mode="exact"):
+    """
+    A function that searches sorted_list for a whole batch of targets
+    Sorted batches are answered with one forward sweep, galloping from the
+    previous answer, so a batch as long as sorted_list costs a merge and a
+    short one a few binary searches. Numeric batches use np.searchsorted
+    when NumPy is available and the conversion pays for itself
+    Arguments:
+        sorted_list: A list or NumPy array sorted in ascending order
+        targets: A list or NumPy array of targets, in any order
+        mode: A string, "exact" for the index of the first element equal to
+              the target or -1, "lower_bound" for the first index whose value
+              is not less than the target, or "upper_bound" for the first
+              index whose value is greater than the target
+    Time complexity:
+        O(m*log(n/m + 1)) for a sorted batch of m targets, O(m*log(n))
+        otherwise, plus O(n + m) to convert lists when NumPy is used.
+    Space complexity:
+        O(m), for the indices.
+    Return: A list of indices, or a NumPy array if targets is one
+    """
+
+    if mode not in SEARCH_MODES:
+        raise ValueError("Unknown search mode: " + str(mode))
+
+    n = len(sorted_list)
+    m = len(targets)
+
+    # Converting a list costs O(n), worth it once the batch does about as much bisection
+    if np is not None and (isinstance(sorted_list, np.ndarray) or m * n.bit_length() >= n):
+        sorted_array = exact_array(sorted_list)
+        target_array = None if sorted_array is None else exact_array(targets)
+
+        # Integers compared against floats, or int64 against uint64, are compared as float64
+        if target_array is not None and \
+                (np.result_type(sorted_array, target_array).kind in "iu" or
+                 sorted_array.dtype.kind == target_array.dtype.kind == "f"):
+            positions = search_many_numpy(sorted_array, target_array, mode)
+            return positions if isinstance(targets, np.ndarray) else positions.tolist()
+
+    upper = mode == "upper_bound"
+    is_sorted = all(not targets[i] < targets[i - 1] for i in range(1, m))
+
+    output_list = []
+    position = 0
+    for target in targets:
+        if is_sorted:
+            # Bounds of a sorted batch never move backwards
+            position = gallop(sorted_list, target, position, n, upper)
+        elif upper:
+            position = upper_bound(sorted_list, target, 0, n)
+        else:
+            position = lower_bound(sorted_list, target, 0, n)
+
+        if mode == "exact" and (position == n or sorted_list[position] != target):
+            output_list.append(-1)
+        else:
+            output_list.append(position)
+
+    if np is not None and isinstance(targets, np.ndarray):
+        return np.array(output_list, dtype=np.intp)
+    return output_list
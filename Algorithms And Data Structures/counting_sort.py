@@ -6,12 +6,115 @@ Stability:  Stable
 """
 
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from radix_sort import radix_sort, radix_sort_numpy
+
+
+# Lists at least this long are sorted with NumPy when it is available
+NUMPY_THRESHOLD = 10000
+
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+# A key range wider than this many buckets per element is treated as sparse
+SPARSE_RANGE_FACTOR = 4
+
+# Ranges up to this size always use the dense count array
+DENSE_RANGE_LIMIT = 1 << 16
+
+
+def is_sparse(n, k):
+    return k > DENSE_RANGE_LIMIT and k > SPARSE_RANGE_FACTOR * n
+
+
+def counting_sort_sparse(input_list):
+    """
+    A function that performs counting sort over only the distinct keys
+    Builds a hash histogram instead of a count array of size max_val - min_val + 1,
+    so a single outlier does not allocate a bucket for every value in between
+    Arguments:
+        input_list: A list of integers
+    Time complexity:
+        O(n + d*b), where d is the number of distinct keys and b is the number
+        of bytes in the key range, as the distinct keys are ordered with a
+        base 256 radix sort.
+    Space complexity:
+        O(n + d), for the output array and the histogram.
+    Return: A new sorted list
+    """
+
+    n = len(input_list)
+    count_map = {}
+    for val in input_list:
+        count_map[val] = count_map.get(val, 0) + 1
+
+    # Starting output position of each distinct key
+    position = {}
+    total = 0
+    for key in radix_sort(list(count_map), 256):
+        position[key] = total
+        total = total + count_map[key]
+
+    # Place elements front to back, so equal keys keep their order
+    output_arr = [0] * n
+    for val in input_list:
+        output_arr[position[val]] = val
+        position[val] = position[val] + 1
+
+    return output_arr
+
+
+def counting_sort_numpy(input_array):
+    """
+    A function that performs counting sort on a NumPy integer array
+    Uses np.bincount over the min-offset values, then expands the counts
+    Arguments:
+        input_array: A 1-d NumPy array of any signed or unsigned integer dtype
+    Time complexity:
+        O(n + k), where k is max_val - min_val + 1. Sparse ranges are
+        handed to radix_sort_numpy instead.
+    Space complexity:
+        O(n + k), for the count array and the output array.
+    Return: A new sorted NumPy array with the same dtype as input_array
+    """
+
+    if input_array.size == 0:
+        return input_array.copy()
+
+    # Too sparse for a count array, hand off to radix sort
+    if is_sparse(input_array.size, int(input_array.max()) - int(input_array.min()) + 1):
+        return radix_sort_numpy(input_array)
+
+    # Unsigned 64-bit arithmetic wraps correctly for any integer dtype
+    min_val = np.uint64(int(input_array.min()) % (1 << 64))
+    offsets = (input_array.astype(np.uint64) - min_val).astype(np.intp)
+
+    # Equal integers are indistinguishable, so expanding the counts is stable
+    count_arr = np.bincount(offsets)
+    values = np.arange(count_arr.size, dtype=np.uint64) + min_val
+    return np.repeat(values, count_arr).astype(input_array.dtype)
+
+
 def counting_sort(input_list):
+    if np is not None and isinstance(input_list, np.ndarray) and input_list.dtype.kind in "iu":
+        return counting_sort_numpy(input_list)
+
     n = len(input_list)
     max_val = max(input_list)
     min_val = min(input_list)
 
+    # int64 conversion would truncate floats, so only lists of integers take this path
+    if np is not None and n >= NUMPY_THRESHOLD and INT64_MIN <= min_val and max_val <= INT64_MAX and \
+            all(type(val) is int for val in input_list):
+        return counting_sort_numpy(np.array(input_list, dtype=np.int64)).tolist()
+
     k = max_val - min_val + 1
+    if is_sparse(n, k):
+        return counting_sort_sparse(input_list)
 
     count_arr = [0] * k
     output_arr = [0] * n
@@ -0,0 +1,245 @@
+"""
+Author:     Chan Guan Yu
+Algorithm:  Data Structure
+Name:       D-ary Heap (Priority Queue)
+"""
+
+
+class Heap:
+    """
+    A class which represents a d-ary min-heap priority queue
+    Keys and items are kept in two parallel lists, so the key of each item is
+    computed once, and sifting moves a hole instead of swapping at every level
+    """
+
+    __slots__ = ("arity", "key", "keys", "items", "positions")
+
+    def __init__(self, items=None, arity=2, key=None, indexed=False):
+        """
+        Initialization of instance variables, heapifies items in O(n)
+        Arguments:
+            items: An iterable of initial items
+            arity: An integer which is the number of children per node,
+                   4 or 8 keep siblings within the same cache lines
+            key: A function that extracts the priority of an item,
+                 defaults to the item itself
+            indexed: A Boolean value, if True, track the position of every
+                     item so update() can find it, items must then be
+                     hashable and unique
+        """
+
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+
+        self.arity = arity
+        self.key = key
+        self.items = [] if items is None else list(items)
+        self.keys = list(self.items) if key is None else [key(item) for item in self.items]
+        self.positions = None
+
+        if indexed:
+            self.positions = {}
+            for i in range(len(self.items)):
+                if self.items[i] in self.positions:
+                    raise ValueError("Indexed heap items must be unique")
+                self.positions[self.items[i]] = i
+
+        self.heapify()
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        if self.positions is not None:
+            return item in self.positions
+        return item in self.items
+
+    def heapify(self):
+        """
+        A method that restores the heap property over the whole heap
+        Time complexity:
+            O(n), sifting down from the last parent, as most nodes are near
+            the bottom and sift only a few levels.
+        Space complexity:
+            O(1)
+        Return: N/A
+        """
+
+        for pos in range((len(self.items) - 2) // self.arity, -1, -1):
+            self.sift_down(pos)
+
+    def sift_up(self, pos):
+        keys, items, positions = self.keys, self.items, self.positions
+        key, item = keys[pos], items[pos]
+
+        while pos > 0:
+            parent = (pos - 1) // self.arity
+            if not key < keys[parent]:
+                break
+            keys[pos] = keys[parent]
+            items[pos] = items[parent]
+            if positions is not None:
+                positions[items[pos]] = pos
+            pos = parent
+
+        keys[pos] = key
+        items[pos] = item
+        if positions is not None:
+            positions[item] = pos
+
+    def sift_down(self, pos):
+        keys, items, positions = self.keys, self.items, self.positions
+        n = len(keys)
+        d = self.arity
+        key, item = keys[pos], items[pos]
+
+        while True:
+            first = d * pos + 1
+            if first >= n:
+                break
+
+            # Smallest of the up to d children
+            best = first
+            best_key = keys[first]
+            for child in range(first + 1, min(first + d, n)):
+                if keys[child] < best_key:
+                    best = child
+                    best_key = keys[child]
+
+            if not best_key < key:
+                break
+            keys[pos] = best_key
+            items[pos] = items[best]
+            if positions is not None:
+                positions[items[pos]] = pos
+            pos = best
+
+        keys[pos] = key
+        items[pos] = item
+        if positions is not None:
+            positions[item] = pos
+
+    def peek(self):
+        if not self.items:
+            raise IndexError("peek from an empty heap")
+        return self.items[0]
+
+    def push(self, item):
+        """
+        A method that adds an item to the heap
+        Time complexity:
+            O(log_d(n)), the new item is sifted up at most the height of the heap.
+        Space complexity:
+            O(1)
+        Return: N/A
+        """
+
+        if self.positions is not None and item in self.positions:
+            raise ValueError("Indexed heap items must be unique")
+
+        self.items.append(item)
+        self.keys.append(item if self.key is None else self.key(item))
+        self.sift_up(len(self.items) - 1)
+
+    def pop(self):
+        """
+        A method that removes and returns the item with the smallest key
+        Time complexity:
+            O(d*log_d(n)), the last item is sifted down from the root, comparing
+            up to d children per level.
+        Space complexity:
+            O(1)
+        Return: The item with the smallest key
+        """
+
+        if not self.items:
+            raise IndexError("pop from an empty heap")
+
+        last_item = self.items.pop()
+        last_key = self.keys.pop()
+        if not self.items:
+            if self.positions is not None:
+                del self.positions[last_item]
+            return last_item
+
+        root = self.items[0]
+        if self.positions is not None:
+            del self.positions[root]
+
+        self.items[0] = last_item
+        self.keys[0] = last_key
+        self.sift_down(0)
+        return root
+
+    def pushpop(self, item):
+        """
+        A method that pushes item, then pops and returns the smallest item
+        Faster than push() followed by pop(), as the heap is sifted at most once
+        Time complexity:
+            O(d*log_d(n))
+        Space complexity:
+            O(1)
+        Return: The item with the smallest key, which may be item itself
+        """
+
+        key = item if self.key is None else self.key(item)
+        if not self.items or not self.keys[0] < key:
+            return item
+
+        return self.replace_root(item, key)
+
+    def replace(self, item):
+        """
+        A method that pops and returns the smallest item, then pushes item
+        Time complexity:
+            O(d*log_d(n))
+        Space complexity:
+            O(1)
+        Return: The item with the smallest key before item was pushed
+        """
+
+        if not self.items:
+            raise IndexError("replace on an empty heap")
+
+        return self.replace_root(item, item if self.key is None else self.key(item))
+
+    def replace_root(self, item, key):
+        if self.positions is not None:
+            if item in self.positions:
+                raise ValueError("Indexed heap items must be unique")
+            del self.positions[self.items[0]]
+
+        root = self.items[0]
+        self.items[0] = item
+        self.keys[0] = key
+        self.sift_down(0)
+        return root
+
+    def update(self, item, key=None):
+        """
+        A method that changes the priority of an item already in the heap
+        Works as decrease-key and increase-key, needs indexed=True
+        Arguments:
+            item: An item in the heap
+            key: The new priority, defaults to recomputing the key function
+                 on item, for items whose fields were changed in place
+        Time complexity:
+            O(d*log_d(n)), the item is found in O(1) and sifted up or down.
+        Space complexity:
+            O(1)
+        Return: N/A
+        """
+
+        if self.positions is None:
+            raise ValueError("update() needs a heap created with indexed=True")
+
+        pos = self.positions[item]
+        if key is None:
+            key = item if self.key is None else self.key(item)
+
+        old_key = self.keys[pos]
+        self.keys[pos] = key
+        if key < old_key:
+            self.sift_up(pos)
+        else:
+            self.sift_down(pos)
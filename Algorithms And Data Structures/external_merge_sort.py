@@ -0,0 +1,274 @@
+"""
+Author:     Chan Guan Yu
+Algorithm:  Sorting
+Name:       External Merge Sort
+Stability:  Stable
+"""
+
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from array import array
+
+from kway_merge import kway_merge
+from merge_sort_adaptive import merge_sort
+
+
+# Record formats, mapped to the array typecode of a fixed-width binary record
+# Text records are newline terminated lines, compared as bytes
+RECORD_FORMATS = {
+    "text": None,
+    "int32": "i",
+    "int64": "q",
+}
+
+# Estimated per-record cost of a Python object and its list slot, in bytes
+RECORD_OVERHEAD = 48
+
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+DEFAULT_FAN_IN = 64
+MIN_BUFFER_SIZE = 64 * 1024
+
+
+class ExternalSortStats:
+    """
+    A class which holds the progress and throughput counters of an external sort
+    """
+
+    def __init__(self):
+        """
+        Initialization of instance variables
+        """
+
+        self.records = 0
+        self.runs = 0
+        self.merge_passes = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.start_time = time.perf_counter()
+        self.end_time = None
+
+    def elapsed(self):
+        """
+        Seconds since the sort started, or its total duration once finished
+        """
+
+        end_time = self.end_time if self.end_time is not None else time.perf_counter()
+        return end_time - self.start_time
+
+    def throughput(self):
+        """
+        Bytes read and written per second, across every pass
+        """
+
+        elapsed = self.elapsed()
+        if elapsed == 0:
+            return 0.0
+        return (self.bytes_read + self.bytes_written) / elapsed
+
+    def as_dict(self):
+        """
+        A dictionary of every counter, suitable for logging or JSON
+        """
+
+        return {
+            "records": self.records,
+            "runs": self.runs,
+            "merge_passes": self.merge_passes,
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+            "elapsed": self.elapsed(),
+            "throughput": self.throughput(),
+        }
+
+
+def read_block(file, typecode, memory_budget):
+    # Read as many records as fit in memory_budget
+    if typecode is None:
+        records = []
+        used = 0
+        for line in file:
+            records.append(line)
+            used = used + len(line) + RECORD_OVERHEAD
+            if used >= memory_budget:
+                break
+
+        # The last line of the file may not be newline terminated
+        if records and not records[-1].endswith(b"\n"):
+            records[-1] = records[-1] + b"\n"
+        return records
+
+    block = array(typecode)
+    count = max(1, memory_budget // (block.itemsize + RECORD_OVERHEAD))
+    try:
+        block.fromfile(file, count)
+    except EOFError:
+        pass
+    return block.tolist()
+
+
+def read_run(path, typecode, buffer_size, stats):
+    # Yields the records of a run file, reading buffer_size bytes at a time
+    with open(path, "rb", buffering=buffer_size) as file:
+        if typecode is None:
+            for line in file:
+                stats.bytes_read = stats.bytes_read + len(line)
+                yield line
+            return
+
+        item_size = array(typecode).itemsize
+        count = max(1, buffer_size // item_size)
+        while True:
+            block = array(typecode)
+            try:
+                block.fromfile(file, count)
+            except EOFError:
+                pass
+            if len(block) == 0:
+                return
+            stats.bytes_read = stats.bytes_read + len(block) * item_size
+            yield from block
+
+
+def write_run(path, records, typecode, buffer_size, stats):
+    with open(path, "wb", buffering=buffer_size) as file:
+        if typecode is None:
+            for record in records:
+                file.write(record)
+                stats.bytes_written = stats.bytes_written + len(record)
+            return
+
+        item_size = array(typecode).itemsize
+        count = max(1, buffer_size // item_size)
+        block = array(typecode)
+        for record in records:
+            block.append(record)
+            if len(block) >= count:
+                block.tofile(file)
+                stats.bytes_written = stats.bytes_written + len(block) * item_size
+                block = array(typecode)
+        block.tofile(file)
+        stats.bytes_written = stats.bytes_written + len(block) * item_size
+
+
+def merge_runs(run_paths, output_path, typecode, buffer_size, stats):
+    # kway_merge only closes sources it opened itself, so the run readers are closed here
+    iterators = [read_run(run_path, typecode, buffer_size, stats) for run_path in run_paths]
+    try:
+        write_run(output_path, kway_merge(iterators), typecode, buffer_size, stats)
+    finally:
+        for iterator in iterators:
+            iterator.close()
+
+
+def create_runs(input_path, typecode, memory_budget, buffer_size, temp_dir, stats, progress):
+    run_paths = []
+    with open(input_path, "rb", buffering=buffer_size) as file:
+        while True:
+            records = read_block(file, typecode, memory_budget)
+            if not records:
+                break
+
+            if typecode is None:
+                stats.bytes_read = stats.bytes_read + sum(len(record) for record in records)
+            else:
+                stats.bytes_read = stats.bytes_read + len(records) * array(typecode).itemsize
+            stats.records = stats.records + len(records)
+
+            merge_sort(records)
+            path = os.path.join(temp_dir, "run_" + str(len(run_paths)))
+            write_run(path, records, typecode, buffer_size, stats)
+            run_paths.append(path)
+
+            stats.runs = stats.runs + 1
+            if progress is not None:
+                progress(stats)
+
+    return run_paths
+
+
+def external_sort(input_path, output_path, record_format="text", memory_budget=DEFAULT_MEMORY_BUDGET,
+                  fan_in=DEFAULT_FAN_IN, temp_dir=None, progress=None):
+    """
+    A function that sorts a file which may be larger than memory
+    Reads blocks that fit in memory_budget, sorts each with the adaptive merge
+    sort and writes it to a temporary run file, then streams a buffered k-way
+    merge of the runs to output_path. If there are more than fan_in runs, they
+    are merged in groups over multiple passes
+    Arguments:
+        input_path: A string which is the path of the file to sort
+        output_path: A string which is the path of the sorted file to write
+        record_format: A string, "text" for newline terminated lines, or
+                       "int32" / "int64" for native-endian fixed-width binary ints
+        memory_budget: An integer which is the approximate number of bytes of
+                       memory to use
+        fan_in: An integer which is the maximum number of runs merged at once
+        temp_dir: A string which is the directory for run files, defaults to
+                  the system temporary directory
+        progress: A function called with the ExternalSortStats after every run
+                  and every merge pass
+    Time complexity:
+        O(n*log(n)), each run is sorted in memory, and each of the
+        log_fan_in(runs) merge passes pushes every record through a heap of
+        fan_in entries.
+    Space complexity:
+        O(memory_budget) in memory, O(n) on disk for the run files.
+    Return: An ExternalSortStats object holding the final counters
+    """
+
+    if record_format not in RECORD_FORMATS:
+        raise ValueError("Unknown record format: " + str(record_format))
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+
+    typecode = RECORD_FORMATS[record_format]
+    if typecode is not None and os.path.getsize(input_path) % array(typecode).itemsize != 0:
+        raise ValueError("File size is not a multiple of the " + record_format + " record width")
+
+    stats = ExternalSortStats()
+    buffer_size = max(MIN_BUFFER_SIZE, memory_budget // (fan_in + 1))
+    work_dir = tempfile.mkdtemp(prefix="external_sort_", dir=temp_dir)
+
+    try:
+        run_paths = create_runs(input_path, typecode, memory_budget, buffer_size, work_dir, stats, progress)
+
+        # Merge groups of fan_in runs until a single pass can produce the output
+        while len(run_paths) > fan_in:
+            next_paths = []
+            for i in range(0, len(run_paths), fan_in):
+                group = run_paths[i:i + fan_in]
+                path = os.path.join(work_dir, "pass_" + str(stats.merge_passes) + "_" + str(len(next_paths)))
+                merge_runs(group, path, typecode, buffer_size, stats)
+                next_paths.append(path)
+
+                for run_path in group:
+                    os.remove(run_path)
+
+            run_paths = next_paths
+            stats.merge_passes = stats.merge_passes + 1
+            if progress is not None:
+                progress(stats)
+
+        merge_runs(run_paths, output_path, typecode, buffer_size, stats)
+        stats.merge_passes = stats.merge_passes + 1
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    stats.end_time = time.perf_counter()
+    if progress is not None:
+        progress(stats)
+
+    return stats
+
+
+if __name__ == "__main__":
+    # Store arguments in variables
+    input_path = sys.argv[1]
+    output_path = sys.argv[2]
+    record_format = sys.argv[3] if len(sys.argv) > 3 else "text"
+
+    # Sort the file
+    external_sort(input_path, output_path, record_format)
@@ -0,0 +1,195 @@
+"""
+Author:     Chan Guan Yu
+Algorithm:  Search
+Name:       Eytzinger Layout Search Index
+"""
+
+
+import argparse
+import random
+import time
+from array import array
+
+import binary_search
+import exponential_search
+from typed_buffer import empty_like
+
+
+DEFAULT_SIZES = [10 ** 5, 10 ** 6, 10 ** 7]
+DEFAULT_QUERIES = 100000
+DEFAULT_SEED = 0
+
+
+class EytzingerIndex:
+    """
+    A class which is a static search index over a sorted sequence, with the
+    elements re-laid in Eytzinger (breadth-first) order
+    Node k has its children at 2k and 2k + 1, so the top levels of the tree,
+    which every search probes, sit together at the front of the array instead
+    of being spread across it as the probes of binary search are
+    """
+
+    __slots__ = ("keys", "ranks", "n")
+
+    def __init__(self, sorted_list):
+        """
+        Initialization of instance variables, lays out the index in O(n)
+        Arguments:
+            sorted_list: A list, array.array or NumPy array sorted in
+                         ascending order, the keys are stored in the same type
+        """
+
+        n = len(sorted_list)
+        self.n = n
+
+        # Slot 0 is unused, ranks[k] is the index of keys[k] in sorted_list
+        self.keys = empty_like(sorted_list, n + 1)
+        self.ranks = array("q", bytes(8 * (n + 1)))
+
+        # An in-order walk of the implicit tree visits the nodes in sorted order
+        stack = []
+        i = 0
+        k = 1
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k = 2 * k
+            k = stack.pop()
+            self.keys[k] = sorted_list[i]
+            self.ranks[k] = i
+            i = i + 1
+            k = 2 * k + 1
+
+    def __len__(self):
+        return self.n
+
+    def __contains__(self, target):
+        return self.search(target) != -1
+
+    def descend(self, target, upper=False):
+        # Node of the first key not less than, or with upper greater than, target, 0 if none
+        keys, n = self.keys, self.n
+        k = 1
+
+        if upper:
+            while k <= n:
+                k = 2 * k if target < keys[k] else 2 * k + 1
+        else:
+            while k <= n:
+                k = 2 * k + 1 if keys[k] < target else 2 * k
+
+        # The answer is where the last left turn was taken, undo it and the right turns after it
+        return k >> (~k & (k + 1)).bit_length()
+
+    def lower_bound(self, target):
+        """
+        A method that finds the first position whose value is not less than target
+        Arguments:
+            target: The value to search for
+        Time complexity:
+            O(log(n))
+        Space complexity:
+            O(1)
+        Return: An integer which is the index in the original sorted list,
+                or n if every value is less than target
+        """
+
+        k = self.descend(target)
+        return self.ranks[k] if k else self.n
+
+    def upper_bound(self, target):
+        """
+        A method that finds the first position whose value is greater than target
+        Arguments:
+            target: The value to search for
+        Time complexity:
+            O(log(n))
+        Space complexity:
+            O(1)
+        Return: An integer which is the index in the original sorted list,
+                or n if no value is greater than target
+        """
+
+        k = self.descend(target, True)
+        return self.ranks[k] if k else self.n
+
+    def search(self, target):
+        """
+        A method that finds target in the index
+        Arguments:
+            target: The value to search for
+        Time complexity:
+            O(log(n))
+        Space complexity:
+            O(1)
+        Return: An integer which is the index of the first occurrence of
+                target in the original sorted list, or -1 if it is absent
+        """
+
+        k = self.descend(target)
+        if k and self.keys[k] == target:
+            return self.ranks[k]
+        return -1
+
+
+def benchmark(sizes=None, queries=DEFAULT_QUERIES, seed=DEFAULT_SEED):
+    """
+    A function that times lookups in an EytzingerIndex against binary search
+    and exponential search on the same sorted array
+    Arguments:
+        sizes: A list of integers which are the array sizes, defaults to
+               DEFAULT_SIZES
+        queries: An integer which is the number of lookups per size, about
+                 half of them hits
+        seed: An integer which seeds the random targets
+    Time complexity:
+        O(s + q*log(s)) for each size s.
+    Space complexity:
+        O(s), the sorted array is an array("q") of even numbers, and the
+        index holds a copy of it and its ranks.
+    Return: A list of dictionaries with size, build time, and the lookup
+            time of each search
+    """
+
+    if sizes is None:
+        sizes = DEFAULT_SIZES
+
+    results = []
+    for size in sizes:
+        rng = random.Random(seed)
+        sorted_array = array("q", range(0, 2 * size, 2))
+        targets = [rng.randrange(2 * size) for _ in range(queries)]
+
+        start = time.perf_counter()
+        index = EytzingerIndex(sorted_array)
+        build_time = time.perf_counter() - start
+
+        timings = {}
+        searches = {
+            "binary_search": lambda target: binary_search.binary_search(sorted_array, target),
+            "exponential_search": lambda target: exponential_search.exponential_search(sorted_array, target),
+            "eytzinger_search": index.search,
+        }
+        for name, search in searches.items():
+            start = time.perf_counter()
+            for target in targets:
+                search(target)
+            timings[name] = time.perf_counter() - start
+
+        results.append({"size": size, "build": build_time, "lookups": queries, "timings": timings})
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the Eytzinger index against binary and exponential search")
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--queries", type=int, default=DEFAULT_QUERIES)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+
+    for result in benchmark(args.sizes, args.queries, args.seed):
+        print("n =", result["size"], "build {:.3f}s".format(result["build"]))
+        for name, elapsed in result["timings"].items():
+            print("   ", name, "{:.3f}s".format(elapsed),
+                  "{:.0f}ns per lookup".format(elapsed / result["lookups"] * 1e9))
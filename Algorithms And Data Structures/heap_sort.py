@@ -6,30 +6,47 @@ Stability:  Unstable
 """
 
 
-def heapify(input_list, n, i):
+import instrumentation
+from d_ary_heap import Heap
+
+
+def heapify(input_list, n, i, low=0):
     largest = i
     left = 2 * i + 1
     right = 2 * i + 2
 
-    if left < n and input_list[left] > input_list[largest]:
+    if left < n and input_list[low + left] > input_list[low + largest]:
         largest = left
 
-    if right < n and input_list[right] > input_list[largest]:
+    if right < n and input_list[low + right] > input_list[low + largest]:
         largest = right
 
+    if instrumentation.ENABLED:
+        instrumentation.count("heap_sort.heapify.comparisons", int(left < n) + int(right < n))
+        instrumentation.count("heap_sort.heapify.swaps", int(largest != i))
+
     if largest != i:
-        input_list[i], input_list[largest] = input_list[largest], input_list[i]
-        heapify(input_list, n, largest)
+        input_list[low + i], input_list[low + largest] = input_list[low + largest], input_list[low + i]
+        heapify(input_list, n, largest, low)
 
 
-def heap_sort(input_list):
-    n = len(input_list)
+def heap_sort(input_list, low=0, high=None):
+    if high is None:
+        high = len(input_list) - 1
+    n = high - low + 1
 
     for i in range(n // 2 - 1, -1, -1):
-        heapify(input_list, n, i)
+        heapify(input_list, n, i, low)
 
     for i in range(n - 1, 0, -1):
-        input_list[i], input_list[0] = input_list[0], input_list[i]
-        heapify(input_list, i, 0)
+        input_list[low + i], input_list[low] = input_list[low], input_list[low + i]
+        heapify(input_list, i, 0, low)
+
+    return input_list
+
 
+def heap_sort_dary(input_list, arity=4):
+    heap = Heap(input_list, arity)
+    for i in range(len(input_list)):
+        input_list[i] = heap.pop()
     return input_list
@@ -9,6 +9,9 @@ import sys
 import heapq
 from collections import deque
 
+import instrumentation
+from d_ary_heap import Heap
+
 
 class Node:
     """
@@ -39,6 +42,16 @@ class Node:
         return "Character: " + self.char + ", Frequency: " + str(self.freq)
 
 
+def node_key(node):
+    """
+    A function that returns the priority of a node as a tuple
+    Orders nodes the same way as Node.__lt__, but tuples are compared
+    without calling back into Python
+    """
+
+    return node.freq, len(node.char)
+
+
 def to_binary(num, encoded_num):
     """
     A function that converts a decimal number to a binary number
@@ -107,12 +120,14 @@ def to_ascii(num):
     return result
 
 
-def huffman_encode(string):
+def huffman_encode(string, arity=None):
     """
     A function that performs Huffman coding
-    Uses heapq and its operations
+    Uses heapq and its operations, or a d-ary Heap when arity is given
     Arguments:
         string: A string to be encoded
+        arity: An integer which is the number of children per heap node,
+               defaults to None, which uses heapq
     Time complexity:
         O(n*log(n)), where n is the number of unique characters in the string.
         In the worst case, n equals to the length of the string. In the main
@@ -130,16 +145,18 @@ def huffman_encode(string):
     heap = []
 
     # Obtain each character's frequency/probability
+    phase_start = instrumentation.now()
     for char in string:
         freq_arr[ord(char)] = freq_arr[ord(char)] + 1
+    instrumentation.record_phase("huffman_elias_header.huffman_encode.frequency_count", phase_start)
 
     # Create heap, insert nodes and heapify heap
+    phase_start = instrumentation.now()
     for i in range(len(freq_arr)):
         if freq_arr[i] != 0:
             char = chr(i)
             freq = freq_arr[i]
             heap.append(Node(char, freq))
-    heapq.heapify(heap)
 
     # If there is only one character
     # Give it the code word "0" and return
@@ -148,12 +165,21 @@ def huffman_encode(string):
         code_word_arr[ord(char)] = "0"
         return
 
+    if arity is None:
+        heapq.heapify(heap)
+        pop = lambda: heapq.heappop(heap)
+        push = lambda node: heapq.heappush(heap, node)
+    else:
+        heap = Heap(heap, arity, key=node_key)
+        pop = heap.pop
+        push = heap.push
+
     # Main algorithm
     # Replace none with deque
     # Deque allows prepend to have constant time complexity, using appendleft()
     while len(heap) > 1:
-        node_1 = heapq.heappop(heap)
-        node_2 = heapq.heappop(heap)
+        node_1 = pop()
+        node_2 = pop()
 
         # In the first "serve", give the characters the code letter "0"
         for c in node_1.char:
@@ -180,7 +206,14 @@ def huffman_encode(string):
         new_char = node_1.char + node_2.char
         new_freq = node_1.freq + node_2.freq
         new_node = Node(new_char, new_freq)
-        heapq.heappush(heap, new_node)
+        push(new_node)
+
+    instrumentation.record_phase("huffman_elias_header.huffman_encode.tree_build", phase_start)
+    if instrumentation.ENABLED:
+        # Each of the unique - 1 merges pops two nodes and pushes one back
+        merges = sum(1 for freq in freq_arr if freq != 0) - 1
+        instrumentation.count("huffman_elias_header.huffman_encode.heap_pops", 2 * merges)
+        instrumentation.count("huffman_elias_header.huffman_encode.heap_pushes", merges)
 
     # After generating the code words for all characters
     # Create a list of tuples (character, code word) as output
@@ -253,9 +286,12 @@ def header_constructor(string):
     """
 
     result = deque([])
+    phase_start = instrumentation.now()
     code_words = huffman_encode(string)
+    instrumentation.record_phase("huffman_elias_header.header_constructor.huffman_encode", phase_start)
 
     # Append the number of unique ASCII characters
+    phase_start = instrumentation.now()
     unique_chars = elias_omega_encode(len(code_words))
     result.append(unique_chars)
 
@@ -274,7 +310,11 @@ def header_constructor(string):
         result.append(code_words[c][1])
 
     result = "".join(result)
+    instrumentation.record_phase("huffman_elias_header.header_constructor.header_emission", phase_start)
+
+    phase_start = instrumentation.now()
     output(result)
+    instrumentation.record_phase("huffman_elias_header.header_constructor.output", phase_start)
     return result
 
 
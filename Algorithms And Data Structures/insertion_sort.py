@@ -6,12 +6,13 @@ Stability:  Stable
 """
 
 
-def insertion_sort(input_list):
-    n = len(input_list)
-    for i in range(1, n):
+def insertion_sort(input_list, low=0, high=None):
+    if high is None:
+        high = len(input_list) - 1
+    for i in range(low + 1, high + 1):
         val = input_list[i]
         j = i - 1
-        while j >= 0 and val < input_list[j]:
+        while j >= low and val < input_list[j]:
             input_list[j + 1] = input_list[j]
             j = j - 1
         input_list[j + 1] = val
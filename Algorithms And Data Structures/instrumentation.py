@@ -0,0 +1,128 @@
+"""
+Author:     Chan Guan Yu
+Algorithm:  Profiling
+Name:       Operation Count and Phase Timing Instrumentation
+"""
+
+
+import json
+import pstats
+import time
+
+
+# Every hook is guarded by this flag, so a disabled hook costs one attribute lookup
+ENABLED = False
+
+counters = {}
+phases = {}
+
+
+def enable():
+    global ENABLED
+    ENABLED = True
+
+
+def disable():
+    global ENABLED
+    ENABLED = False
+
+
+def reset():
+    counters.clear()
+    phases.clear()
+
+
+def count(name, amount=1):
+    """
+    A function that adds amount to the counter called name
+    Arguments:
+        name: A string, by convention "<module>.<function>.<operation>"
+        amount: An integer to add
+    Time complexity:
+        O(1)
+    Space complexity:
+        O(1)
+    Return: N/A
+    """
+
+    counters[name] = counters.get(name, 0) + amount
+
+
+def now():
+    # Start time of a phase, 0 when disabled so no clock is read
+    if ENABLED:
+        return time.perf_counter()
+    return 0
+
+
+def record_phase(name, start):
+    """
+    A function that adds the time since start to the phase called name
+    Arguments:
+        name: A string, by convention "<module>.<function>.<phase>"
+        start: A float returned by now() when the phase began
+    Time complexity:
+        O(1)
+    Space complexity:
+        O(1)
+    Return: N/A
+    """
+
+    if not ENABLED:
+        return
+
+    elapsed = time.perf_counter() - start
+    calls, total = phases.get(name, (0, 0.0))
+    phases[name] = (calls + 1, total + elapsed)
+
+
+def as_dict():
+    return {
+        "counters": dict(counters),
+        "phases": {name: {"calls": calls, "total_time": total} for name, (calls, total) in phases.items()},
+    }
+
+
+def to_json(indent=2):
+    return json.dumps(as_dict(), indent=indent)
+
+
+class StatsSource:
+    """
+    A class which presents the counters and phases in the format pstats.Stats reads
+    from a cProfile.Profile, keyed by (file, line, function)
+    """
+
+    def __init__(self):
+        """
+        Initialization of instance variables
+        """
+
+        self.stats = {}
+
+    def create_stats(self):
+        """
+        Counters become calls with no time, phases become calls with their total time
+        """
+
+        self.stats = {}
+        for name, amount in counters.items():
+            self.stats[("instrumentation", 0, name)] = (amount, amount, 0.0, 0.0, {})
+        for name, (calls, total) in phases.items():
+            self.stats[("instrumentation", 0, name)] = (calls, calls, total, total, {})
+
+
+def to_pstats():
+    """
+    A function that exports the results as cProfile-compatible statistics
+    Arguments:
+        N/A
+    Time complexity:
+        O(c + p), where c and p are the numbers of counters and phases.
+    Space complexity:
+        O(c + p)
+    Return: A pstats.Stats object, which can be printed, sorted, merged with
+            real profiles or saved with dump_stats()
+    """
+
+    return pstats.Stats(StatsSource())
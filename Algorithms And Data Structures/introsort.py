@@ -0,0 +1,140 @@
+"""
+Author:     Chan Guan Yu
+Algorithm:  Sorting
+Name:       Introsort
+Stability:  Unstable
+"""
+
+
+import quick_sort_dutch
+import quick_sort_hoare
+import quick_sort_lomuto
+from heap_sort import heap_sort
+from insertion_sort import insertion_sort
+
+
+# Partitions of this size or smaller are finished with insertion sort
+INSERTION_THRESHOLD = 16
+
+# Partitions larger than this use a ninther instead of a median of three
+NINTHER_THRESHOLD = 128
+
+
+def median_of_three(input_list, a, b, c):
+    x, y, z = input_list[a], input_list[b], input_list[c]
+
+    if x < y:
+        if y < z:
+            return b
+        elif x < z:
+            return c
+        else:
+            return a
+    else:
+        if x < z:
+            return a
+        elif y < z:
+            return c
+        else:
+            return b
+
+
+def choose_pivot(input_list, low, high):
+    mid = low + (high - low) // 2
+
+    if high - low + 1 <= NINTHER_THRESHOLD:
+        return median_of_three(input_list, low, mid, high)
+
+    # Tukey's ninther, the median of the medians of three evenly spaced triples
+    step = (high - low) // 8
+    first = median_of_three(input_list, low, low + step, low + 2 * step)
+    second = median_of_three(input_list, mid - step, mid, mid + step)
+    third = median_of_three(input_list, high - 2 * step, high - step, high)
+    return median_of_three(input_list, first, second, third)
+
+
+def partition_hoare(input_list, low, high, pivot_index):
+    input_list[low], input_list[pivot_index] = input_list[pivot_index], input_list[low]
+    mid = quick_sort_hoare.partition(input_list, low, high)
+    return mid, mid
+
+
+def partition_lomuto(input_list, low, high, pivot_index):
+    input_list[high], input_list[pivot_index] = input_list[pivot_index], input_list[high]
+    mid = quick_sort_lomuto.partition(input_list, low, high)
+    return mid, mid
+
+
+def partition_dutch(input_list, low, high, pivot_index):
+    input_list[low], input_list[pivot_index] = input_list[pivot_index], input_list[low]
+    return quick_sort_dutch.partition(input_list, low, high)
+
+
+PARTITIONS = {
+    "hoare": partition_hoare,
+    "lomuto": partition_lomuto,
+    "dutch": partition_dutch,
+}
+
+
+def introsort(input_list, low=0, high=None, scheme="hoare"):
+    """
+    A function that sorts input_list[low..high] in place using introsort
+    Quick sort with a median-of-three or ninther pivot, which switches to
+    heap sort once the partition depth exceeds 2 * log2(n), and finishes
+    small partitions with insertion sort
+    Arguments:
+        input_list: A list to be sorted
+        low: An integer which is the first index of the range to sort
+        high: An integer which is the last index of the range to sort,
+              defaults to the last index of the list
+        scheme: A string naming the partition routine to use, one of
+                "hoare", "lomuto" or "dutch"
+    Time complexity:
+        O(n*log(n)) in the worst case, as any range that is still being
+        partitioned after 2 * log2(n) levels is handed to heap sort.
+    Space complexity:
+        O(log(n)), the explicit stack always holds the larger side while
+        the smaller side is processed first, so it never grows past log(n)
+        entries and the recursion limit is never reached.
+    Return: The input list, sorted
+    """
+
+    if scheme not in PARTITIONS:
+        raise ValueError("Unknown partition scheme: " + str(scheme))
+    partition = PARTITIONS[scheme]
+
+    if high is None:
+        high = len(input_list) - 1
+    if high <= low:
+        return input_list
+
+    max_depth = 2 * (high - low + 1).bit_length()
+    stack = [(low, high, max_depth)]
+
+    while stack:
+        low, high, depth = stack.pop()
+
+        if high - low + 1 <= INSERTION_THRESHOLD:
+            insertion_sort(input_list, low, high)
+            continue
+
+        # Too many bad pivots, fall back to heap sort for this range
+        if depth == 0:
+            heap_sort(input_list, low, high)
+            continue
+
+        pivot_index = choose_pivot(input_list, low, high)
+        boundary1, boundary2 = partition(input_list, low, high, pivot_index)
+
+        # Push the larger side first, so the smaller side is processed next
+        left = (low, boundary1 - 1, depth - 1)
+        right = (boundary2 + 1, high, depth - 1)
+        if boundary1 - low > high - boundary2:
+            stack.append(left)
+            stack.append(right)
+        else:
+            stack.append(right)
+            stack.append(left)
+
+    return input_list
@@ -0,0 +1,143 @@
+"""
+Author:     Chan Guan Yu
+Algorithm:  Sorting
+Name:       Keyed Sort and Argsort
+Stability:  Stable
+"""
+
+
+import quick_sort_dual_pivot
+import quick_sort_dutch
+import quick_sort_hoare
+import quick_sort_lomuto
+import quick_sort_outofplace
+import merge_sort_adaptive
+import merge_sort_iterative
+from bubble_sort import bubble_sort
+from counting_sort import counting_sort
+from heap_sort import heap_sort, heap_sort_dary
+from insertion_sort import insertion_sort
+from introsort import introsort
+from merge_sort import merge_sort, merge_sort_buffered
+from radix_sort import radix_sort
+from selection_sort import selection_sort
+
+
+# Every sort in the repo behind the same one-argument call, returning the sorted list
+SORTS = {
+    "bubble_sort": bubble_sort,
+    "insertion_sort": insertion_sort,
+    "selection_sort": selection_sort,
+    "heap_sort": heap_sort,
+    "heap_sort_dary": heap_sort_dary,
+    "merge_sort": merge_sort,
+    "merge_sort_buffered": merge_sort_buffered,
+    "merge_sort_iterative": merge_sort_iterative.merge_sort,
+    "merge_sort_adaptive": merge_sort_adaptive.merge_sort,
+    "quick_sort_hoare": lambda input_list: quick_sort_hoare.quick_sort(input_list, 0, len(input_list) - 1),
+    "quick_sort_lomuto": lambda input_list: quick_sort_lomuto.quick_sort(input_list, 0, len(input_list) - 1),
+    "quick_sort_dutch": lambda input_list: quick_sort_dutch.quick_sort(input_list, 0, len(input_list) - 1),
+    "quick_sort_dual_pivot": lambda input_list: quick_sort_dual_pivot.quick_sort(input_list, 0, len(input_list) - 1),
+    "quick_sort_outofplace": quick_sort_outofplace.quick_sort,
+    "introsort": introsort,
+    "introsort_dutch": lambda input_list: introsort(input_list, scheme="dutch"),
+    "counting_sort": counting_sort,
+    "radix_sort": lambda input_list: radix_sort(input_list, 256),
+}
+
+# Sorts that keep equal elements in their original order
+STABLE_SORTS = {
+    "bubble_sort",
+    "insertion_sort",
+    "merge_sort",
+    "merge_sort_buffered",
+    "merge_sort_iterative",
+    "merge_sort_adaptive",
+    "quick_sort_outofplace",
+    "counting_sort",
+    "radix_sort",
+}
+
+# Sorts that only accept integers, keys are packed into a single integer for these
+INTEGER_SORTS = {"counting_sort", "radix_sort"}
+
+
+def integer_argsort(sort_function, keys, reverse):
+    n = len(keys)
+    for k in keys:
+        if type(k) is not int:
+            raise TypeError("Integer sorts need integer keys, got " + type(k).__name__)
+
+    # Pack (key, index) as key * n + index, so equal keys are ordered by index
+    if reverse:
+        max_key = max(keys)
+        packed = [(max_key - keys[i]) * n + i for i in range(n)]
+    else:
+        min_key = min(keys)
+        packed = [(keys[i] - min_key) * n + i for i in range(n)]
+
+    return [val % n for val in sort_function(packed)]
+
+
+def argsort(input_list, algorithm="merge_sort", key=None, reverse=False):
+    """
+    A function that returns the permutation of indices which sorts input_list
+    Each key is computed exactly once, and only (key, index) pairs are sorted,
+    so the records themselves are never moved
+    Arguments:
+        input_list: A list to be sorted
+        algorithm: A string naming the sort to use, one of the keys of SORTS
+        key: A function that extracts the comparison key from a record,
+             defaults to the record itself
+        reverse: A Boolean value, if True, sort in descending order
+    Time complexity:
+        O(n) to extract the keys, plus the time complexity of the chosen sort.
+    Space complexity:
+        O(n), for the keys, the decorated pairs and the output indices.
+    Return: A list of indices, such that input_list[i] for each i is in order.
+            Equal keys keep their original order, whichever algorithm is used
+    """
+
+    if algorithm not in SORTS:
+        raise ValueError("Unknown sorting algorithm: " + str(algorithm))
+    sort_function = SORTS[algorithm]
+
+    n = len(input_list)
+    if n == 0:
+        return []
+
+    if key is None:
+        keys = list(input_list)
+    else:
+        keys = [key(record) for record in input_list]
+
+    if algorithm in INTEGER_SORTS:
+        return integer_argsort(sort_function, keys, reverse)
+
+    # The index breaks ties, which keeps equal keys in order even for unstable sorts
+    # For reverse, ties are broken on -index, so reversing restores the original order
+    if reverse:
+        decorated = sort_function([(keys[i], -i) for i in range(n)])
+        return [-decorated[i][1] for i in range(n - 1, -1, -1)]
+
+    decorated = sort_function([(keys[i], i) for i in range(n)])
+    return [pair[1] for pair in decorated]
+
+
+def keyed_sort(input_list, algorithm="merge_sort", key=None, reverse=False):
+    """
+    A function that sorts input_list by key, using any sort in the repo
+    Arguments:
+        input_list: A list to be sorted
+        algorithm: A string naming the sort to use, one of the keys of SORTS
+        key: A function that extracts the comparison key from a record,
+             defaults to the record itself
+        reverse: A Boolean value, if True, sort in descending order
+    Time complexity:
+        Same as argsort(), plus O(n) to gather the records.
+    Space complexity:
+        O(n), for the indices and the output list.
+    Return: A new list of the records in sorted order
+    """
+
+    return [input_list[i] for i in argsort(input_list, algorithm, key, reverse)]
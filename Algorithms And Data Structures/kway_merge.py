@@ -0,0 +1,100 @@
+"""
+Author:     Chan Guan Yu
+Algorithm:  Merging
+Name:       Lazy K-way Merge
+Stability:  Stable
+"""
+
+
+import heapq
+import os
+
+
+def strip_newline(line):
+    return line.rstrip("\r\n")
+
+
+def read_lines(path, parser, buffer_size):
+    # Yields one parsed record per line, the file is only read as records are consumed
+    with open(path, "r", buffering=buffer_size) as file:
+        for line in file:
+            yield parser(line)
+
+
+def is_path(source):
+    return isinstance(source, (str, os.PathLike))
+
+
+def open_source(source, parser, buffer_size):
+    if is_path(source):
+        return read_lines(source, parser, buffer_size)
+    return iter(source)
+
+
+def kway_merge(sources, key=None, unique=False, parser=strip_newline, buffer_size=64 * 1024):
+    """
+    A function that lazily merges any number of sorted sources
+    Keeps one entry per source in a heap, so the next output is always the
+    smallest head, and sources are read only as far as the output is consumed
+    Arguments:
+        sources: A list of sorted sources, each a list, any iterable, or a
+                 path to a sorted text file with one record per line
+        key: A function that extracts the comparison key from a record,
+             defaults to the record itself
+        unique: A Boolean value, if True, only the first of a run of records
+                with equal keys is yielded
+        parser: A function that turns a line of a file source into a record,
+                defaults to stripping the newline
+        buffer_size: An integer which is the read buffer size of file sources
+    Time complexity:
+        O(m*log(N)), where m is the total number of records and N is the
+        number of sources, each record costs one heap replace.
+    Space complexity:
+        O(N), one heap entry and one open iterator per source, regardless of
+        the total size.
+    Return: A generator of records in sorted order. Records with equal keys
+            come out in source order, and in order within a source
+    """
+
+    iterators = [open_source(source, parser, buffer_size) for source in sources]
+
+    try:
+        # Entries are (key, source index, record), or (record, source index) without key
+        # The source index breaks ties, so records themselves are never compared
+        heap = []
+        for index in range(len(iterators)):
+            for record in iterators[index]:
+                if key is None:
+                    heap.append((record, index))
+                else:
+                    heap.append((key(record), index, record))
+                break
+        heapq.heapify(heap)
+
+        has_last = False
+        last_key = None
+
+        while heap:
+            entry = heap[0]
+            index = entry[1]
+            record = entry[0] if key is None else entry[2]
+
+            if not unique or not has_last or last_key != entry[0]:
+                has_last = True
+                last_key = entry[0]
+                yield record
+
+            for next_record in iterators[index]:
+                if key is None:
+                    heapq.heapreplace(heap, (next_record, index))
+                else:
+                    heapq.heapreplace(heap, (key(next_record), index, next_record))
+                break
+            else:
+                heapq.heappop(heap)
+    finally:
+        # Close any file still open if the consumer stops early
+        # Iterators handed in by the caller are the caller's to close
+        for source, iterator in zip(sources, iterators):
+            if is_path(source):
+                iterator.close()
@@ -6,6 +6,15 @@ Stability:  Stable
 """
 
 
+import instrumentation
+from insertion_sort import insertion_sort
+from typed_buffer import copy_of
+
+
+# Ranges of this size or smaller are finished with insertion sort in merge_sort_buffered
+INSERTION_THRESHOLD = 16
+
+
 def merge(left, right):
     merged_list = []
     i, j = 0, 0
@@ -18,6 +27,10 @@ def merge(left, right):
             merged_list.append(right[j])
             j = j + 1
 
+    if instrumentation.ENABLED:
+        instrumentation.count("merge_sort.merge.comparisons", i + j)
+        instrumentation.count("merge_sort.merge.moves", len(left) + len(right))
+
     while i < len(left):
         merged_list.append(left[i])
         i = i + 1
@@ -40,3 +53,65 @@ def merge_sort(input_list):
         return output_list
     else:
         return input_list
+
+
+def merge_into(source, target, start, mid, end):
+    i, k = start, start
+    j = mid + 1
+
+    while i <= mid and j <= end:
+        if source[i] <= source[j]:
+            target[k] = source[i]
+            i = i + 1
+        else:
+            target[k] = source[j]
+            j = j + 1
+        k = k + 1
+
+    while i <= mid:
+        target[k] = source[i]
+        i = i + 1
+        k = k + 1
+
+    while j <= end:
+        target[k] = source[j]
+        j = j + 1
+        k = k + 1
+
+
+def merge_sort_into(source, target, start, end):
+    # Sorts source[start..end] into target[start..end], both hold the same elements on entry
+    # Each level swaps the roles of the two buffers, so nothing is copied back
+    if end - start + 1 <= INSERTION_THRESHOLD:
+        insertion_sort(target, start, end)
+        return
+
+    mid = start + (end - start) // 2
+    merge_sort_into(target, source, start, mid)
+    merge_sort_into(target, source, mid + 1, end)
+    merge_into(source, target, start, mid, end)
+
+
+def merge_sort_buffered(input_list):
+    """
+    A function that performs merge sort in place, using one auxiliary buffer
+    The buffer is a single copy of the input, and each level of recursion
+    merges from one into the other, so no slices or merged lists are created
+    Arguments:
+        input_list: A list, array.array, memoryview or NumPy array to be
+                    sorted in place
+    Time complexity:
+        O(n*log(n))
+    Space complexity:
+        O(n), a single auxiliary buffer of n elements, of the same type as
+        input_list, plus O(log(n)) for the recursion.
+    Return: The input list, sorted
+    """
+
+    n = len(input_list)
+    if n <= 1:
+        return input_list
+
+    aux = copy_of(input_list)
+    merge_sort_into(aux, input_list, 0, n - 1)
+    return input_list
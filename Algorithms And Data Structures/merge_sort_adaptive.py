@@ -0,0 +1,241 @@
+"""
+Author:     Chan Guan Yu
+Algorithm:  Sorting
+Name:       Merge Sort (Adaptive Natural Runs)
+Stability:  Stable
+"""
+
+
+from typed_buffer import copy_of
+
+
+# Number of consecutive wins by one side before merge() switches to galloping
+MIN_GALLOP = 7
+
+
+def min_run_length(n):
+    # Take the 6 most significant bits of n, adding 1 if any remaining bit is set
+    # so that n / min_run is a power of 2 or slightly less than one
+    r = 0
+    while n >= 64:
+        r = r | (n & 1)
+        n = n >> 1
+    return n + r
+
+
+def reverse_range(input_list, start, end):
+    while start < end:
+        input_list[start], input_list[end] = input_list[end], input_list[start]
+        start = start + 1
+        end = end - 1
+
+
+def count_run(input_list, start, last_index):
+    end = start + 1
+    if end > last_index:
+        return start
+
+    # Only strictly descending runs are reversed, so equal elements keep their order
+    if input_list[end] < input_list[start]:
+        while end + 1 <= last_index and input_list[end + 1] < input_list[end]:
+            end = end + 1
+        reverse_range(input_list, start, end)
+    else:
+        while end + 1 <= last_index and input_list[end + 1] >= input_list[end]:
+            end = end + 1
+
+    return end
+
+
+def binary_insertion_sort(input_list, start, end, sorted_end):
+    # input_list[start..sorted_end] is already sorted
+    for i in range(sorted_end + 1, end + 1):
+        val = input_list[i]
+        low = start
+        high = i
+
+        # Insert after any equal elements to keep the sort stable
+        while low < high:
+            mid = low + (high - low) // 2
+            if val < input_list[mid]:
+                high = mid
+            else:
+                low = mid + 1
+
+        for j in range(i, low, -1):
+            input_list[j] = input_list[j - 1]
+        input_list[low] = val
+
+
+def gallop_right(key, search_list, low, high):
+    # Index of the first element in search_list[low..high] that is greater than key
+    # Brackets the answer by doubling, as in exponential_search.py, then bisects
+    bound = 1
+    while low + bound - 1 <= high and search_list[low + bound - 1] <= key:
+        bound = bound * 2
+
+    lo = low + bound // 2
+    hi = min(low + bound - 1, high + 1)
+    while lo < hi:
+        mid = lo + (hi - lo) // 2
+        if key < search_list[mid]:
+            hi = mid
+        else:
+            lo = mid + 1
+
+    return lo
+
+
+def gallop_left(key, search_list, low, high):
+    # Index of the first element in search_list[low..high] that is not less than key
+    bound = 1
+    while low + bound - 1 <= high and search_list[low + bound - 1] < key:
+        bound = bound * 2
+
+    lo = low + bound // 2
+    hi = min(low + bound - 1, high + 1)
+    while lo < hi:
+        mid = lo + (hi - lo) // 2
+        if search_list[mid] < key:
+            lo = mid + 1
+        else:
+            hi = mid
+
+    return lo
+
+
+def merge(input_list, start, mid, end):
+    # Elements of the left run that are <= the first right element are already in place
+    start = gallop_right(input_list[mid + 1], input_list, start, mid)
+    if start > mid:
+        return
+
+    # Elements of the right run that are >= the last left element are already in place
+    end = gallop_left(input_list[mid], input_list, mid + 1, end) - 1
+
+    # Only the left run is copied out, the right run is merged from where it lies
+    temp_list = copy_of(input_list, start, mid + 1)
+    left_len = len(temp_list)
+    min_gallop = MIN_GALLOP
+    i, j, k = 0, mid + 1, start
+
+    while i < left_len and j <= end:
+        left_wins, right_wins = 0, 0
+
+        # One element at a time, until one side keeps winning
+        while i < left_len and j <= end:
+            if input_list[j] < temp_list[i]:
+                input_list[k] = input_list[j]
+                j = j + 1
+                right_wins = right_wins + 1
+                left_wins = 0
+            else:
+                input_list[k] = temp_list[i]
+                i = i + 1
+                left_wins = left_wins + 1
+                right_wins = 0
+            k = k + 1
+
+            if left_wins >= min_gallop or right_wins >= min_gallop:
+                break
+
+        # Galloping, copy whole blocks found by exponential search
+        while i < left_len and j <= end:
+            count = gallop_right(input_list[j], temp_list, i, left_len - 1) - i
+            input_list[k:k + count] = temp_list[i:i + count]
+            i = i + count
+            k = k + count
+            if i >= left_len:
+                break
+
+            right_count = gallop_left(temp_list[i], input_list, j, end) - j
+            input_list[k:k + right_count] = input_list[j:j + right_count]
+            j = j + right_count
+            k = k + right_count
+            if j > end:
+                break
+
+            # Galloping stopped paying off, make it harder to re-enter
+            if count < MIN_GALLOP and right_count < MIN_GALLOP:
+                min_gallop = min_gallop + 1
+                break
+            min_gallop = max(1, min_gallop - 1)
+
+    # Anything left of the right run is already in place
+    input_list[k:k + left_len - i] = temp_list[i:left_len]
+
+
+def merge_at(input_list, runs, i):
+    start, left_len = runs[i]
+    right_len = runs[i + 1][1]
+    merge(input_list, start, start + left_len - 1, start + left_len + right_len - 1)
+
+    runs[i] = (start, left_len + right_len)
+    del runs[i + 1]
+
+
+def merge_collapse(input_list, runs):
+    # Keep run lengths on the stack such that, for consecutive runs A, B, C
+    # (C on top), A > B + C and B > C
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if (n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or \
+                (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1]):
+            if runs[n - 1][1] < runs[n + 1][1]:
+                n = n - 1
+        elif runs[n][1] > runs[n + 1][1]:
+            break
+        merge_at(input_list, runs, n)
+
+
+def merge_force_collapse(input_list, runs):
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+            n = n - 1
+        merge_at(input_list, runs, n)
+
+
+def merge_sort(input_list):
+    """
+    A function that performs an adaptive, natural-run merge sort (Timsort-style)
+    Finds ascending and strictly descending runs, extends short runs with
+    binary insertion sort, and merges runs under a stack invariant, galloping
+    inside merge() when one side keeps winning
+    Arguments:
+        input_list: A list to be sorted in place
+    Time complexity:
+        O(n) when the input is already sorted or reverse sorted, as it is a
+        single run and no merge takes place. O(n*log(n)) in the worst case,
+        as the stack invariant keeps the merges balanced.
+    Space complexity:
+        O(n), the left run of each merge is copied out after trimming the
+        elements already in place, and the run stack holds O(log(n)) entries.
+    Return: The input list, sorted
+    """
+
+    n = len(input_list)
+    if n <= 1:
+        return input_list
+
+    min_run = min_run_length(n)
+    last_index = n - 1
+    runs = []
+
+    start = 0
+    while start <= last_index:
+        end = count_run(input_list, start, last_index)
+
+        # Extend short runs to min_run using binary insertion sort
+        if end - start + 1 < min_run:
+            forced_end = min(start + min_run - 1, last_index)
+            binary_insertion_sort(input_list, start, forced_end, end)
+            end = forced_end
+
+        runs.append((start, end - start + 1))
+        merge_collapse(input_list, runs)
+        start = end + 1
+
+    merge_force_collapse(input_list, runs)
+
+    return input_list
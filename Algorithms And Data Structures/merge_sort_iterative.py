@@ -6,6 +6,10 @@ Stability:  Stable
 """
 
 
+import instrumentation
+from typed_buffer import empty_like
+
+
 def merge(input_list, temp_list, start, mid, end):
     i, k = start, start
     j = mid + 1
@@ -19,6 +23,10 @@ def merge(input_list, temp_list, start, mid, end):
             j = j + 1
         k = k + 1
 
+    if instrumentation.ENABLED:
+        instrumentation.count("merge_sort_iterative.merge.comparisons", (i - start) + (j - mid - 1))
+        instrumentation.count("merge_sort_iterative.merge.moves", 2 * (end - start + 1))
+
     while i <= mid:
         temp_list[k] = input_list[i]
         i = i + 1
@@ -36,7 +44,7 @@ def merge(input_list, temp_list, start, mid, end):
 def merge_sort(input_list):
     n = len(input_list)
     last_index = n - 1
-    temp_list = [0] * n
+    temp_list = empty_like(input_list, n)
 
     if n <= 1:
         return input_list
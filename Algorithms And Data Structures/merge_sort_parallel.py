@@ -0,0 +1,119 @@
+"""
+Author:     Chan Guan Yu
+Algorithm:  Sorting
+Name:       Merge Sort (Parallel)
+Stability:  Stable
+"""
+
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from kway_merge import kway_merge
+from merge_sort import merge_sort
+
+
+# Inputs with fewer elements than this per worker stay on the serial path
+GRAIN_SIZE = 50000
+
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+
+def buffer_typecode(input_list):
+    # Typecode of an array buffer that can hold every element, or None for arbitrary objects
+    if all(type(val) is int for val in input_list):
+        if INT64_MIN <= min(input_list) and max(input_list) <= INT64_MAX:
+            return "q"
+    elif all(type(val) is float for val in input_list):
+        return "d"
+    return None
+
+
+def sort_shared_chunk(name, typecode, start, end):
+    # Runs in a worker process, sorts buffer[start:end] of the shared block in place
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        buffer = shm.buf.cast(typecode)
+        try:
+            buffer[start:end] = array(typecode, merge_sort(buffer[start:end].tolist()))
+        finally:
+            buffer.release()
+    finally:
+        shm.close()
+
+
+def chunk_bounds(n, chunks):
+    size = -(-n // chunks)
+    return [(start, min(start + size, n)) for start in range(0, n, size)]
+
+
+def parallel_merge_sort(input_list, workers=None):
+    """
+    A function that performs merge sort across multiple processes
+    Splits the input into one chunk per worker, sorts each chunk with
+    merge_sort.merge_sort in a process pool, then combines the sorted chunks
+    with a k-way heap merge. Lists of ints or floats are handed to the workers
+    through a shared memory array buffer instead of being pickled
+    Arguments:
+        input_list: A list to be sorted
+        workers: An integer which is the number of worker processes,
+                 defaults to os.cpu_count()
+    Time complexity:
+        O((n/p)*log(n/p) + n*log(p)), where p is the number of workers. Each
+        worker sorts n/p elements, and the k-way merge pushes every element
+        through a heap of p entries.
+    Space complexity:
+        O(n), the shared buffer and the output list each hold n elements.
+    Return: A new sorted list
+    """
+
+    n = len(input_list)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, n // GRAIN_SIZE)
+
+    # Small inputs are not worth the process start-up cost
+    if workers <= 1:
+        return merge_sort(input_list)
+
+    bounds = chunk_bounds(n, workers)
+    typecode = buffer_typecode(input_list)
+
+    # Arbitrary objects cannot live in a shared buffer, so chunks are pickled
+    if typecode is None:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            sorted_chunks = list(executor.map(merge_sort, [input_list[start:end] for start, end in bounds]))
+        return list(kway_merge(sorted_chunks))
+
+    item_size = array(typecode).itemsize
+    shm = shared_memory.SharedMemory(create=True, size=n * item_size)
+    buffer = None
+    sorted_chunks = []
+    try:
+        try:
+            buffer = shm.buf.cast(typecode)
+            buffer[:] = array(typecode, input_list)
+
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(sort_shared_chunk, shm.name, typecode, start, end)
+                           for start, end in bounds]
+                for future in futures:
+                    future.result()
+
+            # Merge straight out of the shared buffer, without copying the chunks
+            sorted_chunks = [buffer[start:end] for start, end in bounds]
+            output_list = list(kway_merge(sorted_chunks))
+        finally:
+            # Views must be released before the block can be closed, even when an error is raised
+            for chunk in sorted_chunks:
+                chunk.release()
+            if buffer is not None:
+                buffer.release()
+            shm.close()
+    finally:
+        shm.unlink()
+
+    return output_list
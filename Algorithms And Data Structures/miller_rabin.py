@@ -7,6 +7,8 @@ Name:       Miller-Rabin Primality Test
 
 import random
 
+import instrumentation
+
 
 def mod_exp(base, exp, mod):
     """
@@ -48,6 +50,10 @@ def mod_exp(base, exp, mod):
         base = (base * base) % mod
         i = i + 1
 
+    if instrumentation.ENABLED:
+        # One squaring per bit, plus one multiplication into result per set bit
+        instrumentation.count("miller_rabin.mod_exp.multiplications", i + bin(og_exp).count("1"))
+
     return result
 
 
@@ -81,6 +87,8 @@ def miller_rabin(n, k=64):
         t = t//2
 
     for x in range(k):
+        if instrumentation.ENABLED:
+            instrumentation.count("miller_rabin.miller_rabin.witness_rounds")
 
         # Choose random number in the range 1 < a < n - 1
         a = random.randrange(2, n - 1)
@@ -5,6 +5,9 @@ Name:       Modular Exponentiation
 """
 
 
+import instrumentation
+
+
 def mod_exp(base, exp, mod):
     """
     A function that performs pow(base, exp, mod)
@@ -45,4 +48,8 @@ def mod_exp(base, exp, mod):
         base = (base * base) % mod
         i = i + 1
 
+    if instrumentation.ENABLED:
+        # One squaring per bit, plus one multiplication into result per set bit
+        instrumentation.count("modular_exponentiation.mod_exp.multiplications", i + bin(og_exp).count("1"))
+
     return result
@@ -0,0 +1,152 @@
+"""
+Author:     Chan Guan Yu
+Algorithm:  Selection
+Name:       Quickselect (nth_element, partial_sort and top_k)
+"""
+
+
+import heapq
+
+from heap_sort import heapify, heap_sort
+from insertion_sort import insertion_sort
+from introsort import INSERTION_THRESHOLD, PARTITIONS, choose_pivot, introsort
+
+
+def nth_element(input_list, k, low=0, high=None, scheme="hoare"):
+    """
+    A function that performs introselect
+    Rearranges input_list[low..high] in place so that input_list[k] holds
+    the element that would be there if the range were sorted, with nothing
+    greater before it and nothing smaller after it
+    Arguments:
+        input_list: A list
+        k: An integer which is the index to select, low <= k <= high
+        low: An integer which is the first index of the range
+        high: An integer which is the last index of the range, defaults to
+              the last index of the list
+        scheme: A string naming the partition routine to use, one of
+                "hoare", "lomuto" or "dutch"
+    Time complexity:
+        O(n) expected, as only the side holding k is partitioned further.
+        O(n*log(n)) in the worst case, as a range still being partitioned
+        after 2 * log2(n) rounds is heap sorted instead.
+    Space complexity:
+        O(1), the loop keeps only the current range.
+    Return: The k-th smallest element, input_list[k]
+    """
+
+    if scheme not in PARTITIONS:
+        raise ValueError("Unknown partition scheme: " + str(scheme))
+    partition = PARTITIONS[scheme]
+
+    if high is None:
+        high = len(input_list) - 1
+    if not low <= k <= high:
+        raise IndexError("k is outside the range being selected from")
+
+    depth = 2 * (high - low + 1).bit_length()
+    while low < high:
+        if high - low + 1 <= INSERTION_THRESHOLD:
+            insertion_sort(input_list, low, high)
+            break
+
+        # Too many bad pivots, fall back to heap sort for this range
+        if depth == 0:
+            heap_sort(input_list, low, high)
+            break
+        depth = depth - 1
+
+        pivot_index = choose_pivot(input_list, low, high)
+        boundary1, boundary2 = partition(input_list, low, high, pivot_index)
+
+        if k < boundary1:
+            high = boundary1 - 1
+        elif k > boundary2:
+            low = boundary2 + 1
+        else:
+            break
+
+    return input_list[k]
+
+
+def partial_sort(input_list, k, scheme="hoare"):
+    """
+    A function that sorts only the k smallest elements of input_list in place
+    Selects the k-th smallest with nth_element(), then sorts the front
+    Arguments:
+        input_list: A list
+        k: An integer which is the number of smallest elements to sort
+        scheme: A string naming the partition routine to use, one of
+                "hoare", "lomuto" or "dutch"
+    Time complexity:
+        O(n + k*log(k)), for the selection and the sort of the front.
+    Space complexity:
+        O(log(k)), for the introsort stack.
+    Return: The input list, with input_list[:k] sorted and holding the k
+            smallest elements, the rest in no particular order
+    """
+
+    n = len(input_list)
+    if k <= 0:
+        return input_list
+    if k >= n:
+        return introsort(input_list, scheme=scheme)
+
+    nth_element(input_list, k - 1, scheme=scheme)
+    return introsort(input_list, 0, k - 1, scheme)
+
+
+def top_k(iterable, k, key=None, reverse=False):
+    """
+    A function that finds the k smallest items of a stream
+    Keeps a max-heap of the k smallest items seen so far, so any iterable,
+    including an unbounded one, can be consumed with O(k) memory
+    Arguments:
+        iterable: An iterable of items
+        k: An integer which is the number of items to keep
+        key: A function that extracts the comparison key from an item,
+             defaults to the item itself
+        reverse: A Boolean value, if True, find the k largest items instead
+    Time complexity:
+        O(n*log(k)), each item costs at most one sift of a heap of k entries.
+    Space complexity:
+        O(k), for the heap.
+    Return: A list of the k smallest (or largest) items in sorted order,
+            equal keys keep their order of arrival
+    """
+
+    if k <= 0:
+        return []
+
+    # Entries are (key, arrival index, item), so items themselves are never compared
+    heap = []
+    index = 0
+
+    if reverse:
+        # Min-heap with heapq, later arrivals among equal keys are evicted first
+        for item in iterable:
+            entry = (item if key is None else key(item), -index, item)
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif heap[0] < entry:
+                heapq.heapreplace(heap, entry)
+            index = index + 1
+
+        heap_sort(heap)
+        return [heap[i][2] for i in range(len(heap) - 1, -1, -1)]
+
+    # Max-heap with heap_sort.heapify, its root is the largest of the k kept
+    for item in iterable:
+        entry = (item if key is None else key(item), index, item)
+        if len(heap) < k:
+            heap.append(entry)
+            if len(heap) == k:
+                for i in range(k // 2 - 1, -1, -1):
+                    heapify(heap, k, i)
+        elif entry < heap[0]:
+            heap[0] = entry
+            heapify(heap, k, 0)
+        index = index + 1
+
+    heap_sort(heap)
+    return [entry[2] for entry in heap]
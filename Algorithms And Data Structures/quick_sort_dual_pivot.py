@@ -0,0 +1,112 @@
+"""
+Author:     Chan Guan Yu
+Algorithm:  Sorting
+Name:       Quick Sort (Dual-Pivot)
+Stability:  Unstable
+"""
+
+
+import quick_sort_dutch
+from insertion_sort import insertion_sort
+
+
+# Ranges of this size or smaller are finished with insertion sort
+INSERTION_THRESHOLD = 27
+
+
+def sort_sample(input_list, indices):
+    # Insertion sort of the elements at the given positions, in place
+    for a in range(1, len(indices)):
+        val = input_list[indices[a]]
+        b = a - 1
+        while b >= 0 and val < input_list[indices[b]]:
+            input_list[indices[b + 1]] = input_list[indices[b]]
+            b = b - 1
+        input_list[indices[b + 1]] = val
+
+
+def partition(input_list, low, high):
+    # Yaroslavskiy partition, assumes input_list[low] <= input_list[high]
+    pivot1 = input_list[low]
+    pivot2 = input_list[high]
+    lt = low + 1
+    gt = high - 1
+    k = lt
+
+    while k <= gt:
+        if input_list[k] < pivot1:
+            input_list[k], input_list[lt] = input_list[lt], input_list[k]
+            lt = lt + 1
+        elif input_list[k] > pivot2:
+            while input_list[gt] > pivot2 and k < gt:
+                gt = gt - 1
+            input_list[k], input_list[gt] = input_list[gt], input_list[k]
+            gt = gt - 1
+            if input_list[k] < pivot1:
+                input_list[k], input_list[lt] = input_list[lt], input_list[k]
+                lt = lt + 1
+        k = k + 1
+
+    # Move the pivots to their final positions
+    lt = lt - 1
+    gt = gt + 1
+    input_list[low], input_list[lt] = input_list[lt], input_list[low]
+    input_list[high], input_list[gt] = input_list[gt], input_list[high]
+
+    return lt, gt
+
+
+def quick_sort(input_list, low, high):
+    stack = [(low, high)]
+
+    while stack:
+        low, high = stack.pop()
+
+        if high - low + 1 <= INSERTION_THRESHOLD:
+            if low < high:
+                insertion_sort(input_list, low, high)
+            continue
+
+        # Five evenly spaced samples, the second and fourth become the pivots
+        seventh = (high - low + 1) // 7
+        e3 = low + (high - low) // 2
+        e2 = e3 - seventh
+        e1 = e2 - seventh
+        e4 = e3 + seventh
+        e5 = e4 + seventh
+        sort_sample(input_list, [e1, e2, e3, e4, e5])
+
+        if input_list[e2] == input_list[e4]:
+            # Equal pivots, likely many equal keys, split three ways around one pivot
+            input_list[low], input_list[e3] = input_list[e3], input_list[low]
+            boundary1, boundary2 = quick_sort_dutch.partition(input_list, low, high)
+            ranges = [(low, boundary1 - 1), (boundary2 + 1, high)]
+        else:
+            input_list[low], input_list[e2] = input_list[e2], input_list[low]
+            input_list[high], input_list[e4] = input_list[e4], input_list[high]
+            boundary1, boundary2 = partition(input_list, low, high)
+
+            # The middle range only needs sorting if the pivots differ
+            ranges = [(low, boundary1 - 1), (boundary2 + 1, high)]
+            if input_list[boundary1] < input_list[boundary2]:
+                ranges.append((boundary1 + 1, boundary2 - 1))
+
+        # Push the largest range first, so the smallest is processed next
+        ranges.sort(key=lambda r: r[0] - r[1])
+        stack.extend(ranges)
+
+    return input_list
+
+
+if __name__ == "__main__":
+    from sort_benchmark import run_benchmark
+
+    # Compare against the other in-place quick sorts
+    report = run_benchmark(["quick_sort_hoare", "quick_sort_lomuto", "quick_sort_dutch", "quick_sort_dual_pivot"],
+                           sizes=[1000, 10000])
+    for result in report["results"]:
+        if "error" in result:
+            print(result["algorithm"], result["shape"], result["size"], result["error"])
+        else:
+            print(result["algorithm"], result["shape"], result["size"],
+                  "{:.4f}s".format(result["time"]), result["comparisons"], "comparisons", result["writes"], "writes")
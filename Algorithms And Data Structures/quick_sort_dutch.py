@@ -6,8 +6,12 @@ Stability:  Unstable
 """
 
 
+import instrumentation
+
+
 def partition(input_list, low, high):
     pivot = input_list[low]
+    start, end = low, high
     j = low + 1
 
     while j <= high:
@@ -21,6 +25,14 @@ def partition(input_list, low, high):
             input_list[j], input_list[high] = input_list[high], input_list[j]
             high = high - 1
 
+    if instrumentation.ENABLED:
+        # Elements less than the pivot moved low, greater ones moved high, the rest were equal
+        less = low - start
+        greater = end - high
+        equal = end - start - less - greater
+        instrumentation.count("quick_sort_dutch.partition.comparisons", less + 2 * (equal + greater))
+        instrumentation.count("quick_sort_dutch.partition.swaps", less + greater)
+
     return low, high
 
 
@@ -6,15 +6,20 @@ Stability:  Unstable
 """
 
 
+import instrumentation
+
+
 def partition(input_list, low, high):
     pivot = input_list[low]
     i = low + 1
     j = high
+    swaps = 0
 
     while True:
         while i <= j and input_list[i] <= pivot:
             i = i + 1
 
+        j_scan_start = j
         while i <= j and input_list[j] > pivot:
             j = j - 1
 
@@ -22,8 +27,16 @@ def partition(input_list, low, high):
             break
 
         input_list[i], input_list[j] = input_list[j], input_list[i]
+        swaps = swaps + 1
     input_list[low], input_list[j] = input_list[j], input_list[low]
 
+    if instrumentation.ENABLED:
+        # Every move of i or j is a comparison, plus the two failed comparisons that end
+        # the scans before each swap, plus one more if the last i scan ended on a comparison
+        comparisons = (i - low - 1) + (high - j) + 2 * swaps + int(j < j_scan_start)
+        instrumentation.count("quick_sort_hoare.partition.comparisons", comparisons)
+        instrumentation.count("quick_sort_hoare.partition.swaps", swaps + 1)
+
     return j
 
 
@@ -0,0 +1,136 @@
+"""
+Author:     Chan Guan Yu
+Algorithm:  Sorting
+Name:       Quick Sort (Incremental)
+Stability:  Stable
+"""
+
+
+from insertion_sort import insertion_sort
+from introsort import choose_pivot
+from quick_sort_outofplace import partition
+
+
+# Partitions of this size or smaller are finished with insertion sort
+INSERTION_THRESHOLD = 16
+
+
+class LazySorted:
+    """
+    A class which yields the elements of an iterable in sorted order, doing
+    only as much out-of-place partitioning as the elements read so far need
+    The partition holding the smallest unread elements is always on top of a
+    stack, so each read only splits that partition until its front is sorted
+    Reading the first k elements costs O(n + k*log(k)) expected time
+    """
+
+    __slots__ = ("stack", "output", "position")
+
+    def __init__(self, iterable):
+        """
+        Initialization of instance variables
+        """
+
+        data = list(iterable)
+
+        # Entries are (partition, is_sorted), the top holds the smallest unread elements
+        self.stack = [(data, False)] if data else []
+        # Sorted prefix produced so far, kept so slices can be read again
+        self.output = []
+        # Index of the next element returned by next()
+        self.position = 0
+
+    def advance(self):
+        """
+        A method that moves the next sorted block of elements to the output
+        Arguments:
+            None
+        Time complexity:
+            O(m) expected, where m is the size of the partition on top of the
+            stack, which shrinks geometrically on each split.
+        Space complexity:
+            O(m), for the out-of-place partition.
+        Return: A Boolean value, False if every element has already been output
+        """
+
+        stack = self.stack
+
+        while stack:
+            block, is_sorted = stack.pop()
+
+            if not is_sorted and len(block) <= INSERTION_THRESHOLD:
+                insertion_sort(block)
+                is_sorted = True
+
+            if is_sorted:
+                self.output.extend(block)
+                return True
+
+            left, pivots, right = partition(block, choose_pivot(block, 0, len(block) - 1))
+
+            # Elements equal to the pivot are already in order, they are never partitioned again
+            if right:
+                stack.append((right, False))
+            stack.append((pivots, True))
+            if left:
+                stack.append((left, False))
+
+        return False
+
+    def fill(self, count):
+        # Extends the output until it holds count elements or everything
+        while len(self.output) < count and self.advance():
+            pass
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.position >= len(self.output):
+            self.fill(self.position + 1)
+            if self.position >= len(self.output):
+                raise StopIteration
+
+        val = self.output[self.position]
+        self.position = self.position + 1
+        return val
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.start, index.stop, index.step
+
+            # Negative or open bounds are relative to the end, so everything must be sorted
+            if stop is None or stop < 0 or (start is not None and start < 0) or (step is not None and step < 0):
+                self.fill(float("inf"))
+            else:
+                self.fill(stop)
+            return self.output[start:stop:step]
+
+        if index < 0:
+            self.fill(float("inf"))
+        else:
+            self.fill(index + 1)
+        return self.output[index]
+
+    def take(self, k):
+        """
+        A method that returns the next k elements in sorted order, and
+        resumes from there on the following call
+        Arguments:
+            k: An integer which is the number of elements to return
+        Time complexity:
+            O(k*log(k) + m) expected, where m is the size of the partitions
+            split to reach them.
+        Space complexity:
+            O(k)
+        Return: A list of at most k elements
+        """
+
+        self.fill(self.position + k)
+        page = self.output[self.position:self.position + k]
+        self.position = self.position + len(page)
+        return page
+
+
+def quick_sort(iterable):
+    return LazySorted(iterable)
@@ -6,6 +6,9 @@ Stability:  Unstable
 """
 
 
+import instrumentation
+
+
 def partition(input_list, low, high):
     pivot = input_list[high]
     i = low - 1
@@ -16,6 +19,10 @@ def partition(input_list, low, high):
             input_list[i], input_list[j] = input_list[j], input_list[i]
     input_list[i + 1], input_list[high] = input_list[high], input_list[i + 1]
 
+    if instrumentation.ENABLED:
+        instrumentation.count("quick_sort_lomuto.partition.comparisons", high - low)
+        instrumentation.count("quick_sort_lomuto.partition.swaps", i + 2 - low)
+
     return i + 1
 
 
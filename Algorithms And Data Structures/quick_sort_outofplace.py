@@ -6,20 +6,30 @@ Stability:  Stable
 """
 
 
-def partition(input_list):
+import instrumentation
+
+
+def partition(input_list, pivot_index=0):
     n = len(input_list)
-    pivot = input_list[0]
-    pivots = [pivot]
-    left, right = [], []
+    pivot = input_list[pivot_index]
+    left, pivots, right = [], [], []
 
-    for i in range(1, n):
-        if input_list[i] < pivot:
+    # The pivot is scanned in place with everything else, so equal elements keep their order
+    # It always goes into pivots itself, so each partition makes progress even when pivot != pivot (NaN)
+    for i in range(n):
+        if i == pivot_index:
+            pivots.append(pivot)
+        elif input_list[i] < pivot:
             left.append(input_list[i])
         elif input_list[i] == pivot:
             pivots.append(input_list[i])
         else:
             right.append(input_list[i])
 
+    if instrumentation.ENABLED:
+        comparisons = len(left) + 2 * (len(pivots) - 1 + len(right))
+        instrumentation.count("quick_sort_outofplace.partition.comparisons", comparisons)
+
     return left, pivots, right
 
 
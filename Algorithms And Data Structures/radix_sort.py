@@ -6,52 +6,282 @@ Stability:  Stable
 """
 
 
-def counting_sort(input_list, col, base):
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from merge_sort_adaptive import merge_sort
+
+
+# Lists at least this long are sorted with NumPy when it is available
+NUMPY_THRESHOLD = 10000
+
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+# Unsigned array typecode of the same width, and the width, of each float typecode
+FLOAT_TYPECODES = {"d": ("Q", 64), "f": ("I", 32)}
+
+
+def counting_sort(input_list, col, base, key=None):
     n = len(input_list)
     count_arr = [0] * base
     output_arr = [0] * n
+    divisor = base ** col
 
-    for val in input_list:
-        index = (val // (base ** col)) % base
+    # With a key, elements are ordered by key(element), which must be a non-negative integer
+    keys = input_list if key is None else [key(val) for val in input_list]
+
+    for val in keys:
+        index = (val // divisor) % base
         count_arr[index] = count_arr[index] + 1
 
     for i in range(1, base):
         count_arr[i] = count_arr[i] + count_arr[i - 1]
 
     for i in range(n - 1, -1, -1):
-        val = input_list[i]
-        index = (val // (base ** col)) % base
-        output_arr[count_arr[index] - 1] = val
+        index = (keys[i] // divisor) % base
+        output_arr[count_arr[index] - 1] = input_list[i]
         count_arr[index] = count_arr[index] - 1
 
     return output_arr
 
 
+def digit_count(min_key, max_key, base):
+    # Every key between min_key and max_key shares the digits where they agree
+    # from the most significant end, so only the lower digits need a pass
+    digits = 0
+    while min_key != max_key:
+        min_key = min_key // base
+        max_key = max_key // base
+        digits = digits + 1
+    return digits
+
+
+def float_keys(input_list, typecode="d"):
+    """
+    A function that maps IEEE floats to unsigned integers in the same order
+    The bit patterns are read in bulk through array. Positive floats get the
+    sign bit set, so they come after every negative float, and negative floats
+    have every bit flipped, which reverses their order
+    Arguments:
+        input_list: A list of floats, or an array.array of typecode
+        typecode: A string, "d" for float64 or "f" for float32
+    Time complexity:
+        O(n)
+    Space complexity:
+        O(n), for the keys.
+    Return: A list of non-negative integers. -0.0 maps below 0.0, negative NaNs
+            below every number and positive NaNs above
+    """
+
+    uint_typecode, width = FLOAT_TYPECODES[typecode]
+    sign = 1 << (width - 1)
+    mask = (1 << width) - 1
+
+    bits = array(uint_typecode, array(typecode, input_list).tobytes())
+    return [b ^ mask if b & sign else b | sign for b in bits]
+
+
+def float_values(keys, typecode="d"):
+    """
+    A function that maps keys made by float_keys() back to floats
+    Arguments:
+        keys: A list of integers returned by float_keys()
+        typecode: A string, "d" for float64 or "f" for float32
+    Time complexity:
+        O(n)
+    Space complexity:
+        O(n)
+    Return: A list of floats, bit for bit the ones the keys were made from
+    """
+
+    uint_typecode, width = FLOAT_TYPECODES[typecode]
+    sign = 1 << (width - 1)
+    mask = (1 << width) - 1
+
+    bits = array(uint_typecode, [k ^ sign if k & sign else k ^ mask for k in keys])
+    return array(typecode, bits.tobytes()).tolist()
+
+
+def order_keys(input_list):
+    """
+    A function that maps a column of numbers to non-negative integers in the
+    same order. Floats take a bit transform, negative integers a min offset
+    Arguments:
+        input_list: A list of integers or floats, an array.array or a 1-d
+                    NumPy array
+    Time complexity:
+        O(n), non-negative integers are used as they are.
+    Space complexity:
+        O(n), for the keys.
+    Return: A list of non-negative integers. A column mixing integers and
+            floats raises TypeError
+    """
+
+    if isinstance(input_list, array):
+        if input_list.typecode in FLOAT_TYPECODES:
+            return float_keys(input_list, input_list.typecode)
+        input_list = input_list.tolist()
+    elif np is not None and isinstance(input_list, np.ndarray):
+        if input_list.dtype.kind == "f":
+            typecode = "f" if input_list.dtype.itemsize <= 4 else "d"
+            return float_keys(input_list.tolist(), typecode)
+        input_list = input_list.tolist()
+
+    if any(type(val) is float for val in input_list):
+        # float64 cannot hold every integer exactly, so mixed columns have no exact key
+        if not all(type(val) is float for val in input_list):
+            raise TypeError("A column mixing integers and floats cannot be radix sorted")
+        return float_keys(input_list, "d")
+
+    min_val = min(input_list)
+    if min_val >= 0:
+        return input_list
+
+    return [val - min_val for val in input_list]
+
+
+def radix_sort_columns(columns, base=256):
+    """
+    A function that performs LSD radix sort on composite keys, given as columns
+    Sorts row indices by the last column first, one stable counting pass per
+    digit, so rows tie-broken by later columns stay in that order when an
+    earlier column is sorted. No key tuples are built
+    Arguments:
+        columns: A list of equally long columns, each a list of integers, a
+                 list of floats, an array.array or a 1-d NumPy array. Rows are
+                 compared by the first column, then the second, and so on
+        base: An integer which is the radix of each pass
+    Time complexity:
+        O(d*(n + base)), where d is the total number of digits over all
+        columns, counting only digits that differ between the column's
+        smallest and largest key.
+    Space complexity:
+        O(n + base), for the keys of one column and the index lists.
+    Return: A list of row indices in sorted order, stable for equal rows
+    """
+
+    if not columns:
+        return []
+
+    order = list(range(len(columns[0])))
+    if len(order) <= 1:
+        return order
+
+    for column in reversed(columns):
+        keys = order_keys(column)
+        for col in range(digit_count(min(keys), max(keys), base)):
+            order = counting_sort(order, col, base, keys.__getitem__)
+
+    return order
+
+
+def numpy_keys(input_array):
+    # Unsigned keys in the same order, from the sign bit transform for signed integers
+    # and floats, negative floats have every bit flipped to reverse their order
+    dtype = input_array.dtype
+    if not dtype.isnative:
+        input_array = input_array.astype(dtype.newbyteorder("="))
+
+    uint_dtype = np.dtype("u" + str(dtype.itemsize))
+    keys = input_array.view(uint_dtype)
+    if dtype.kind == "u":
+        return keys
+
+    sign = uint_dtype.type(1 << (8 * dtype.itemsize - 1))
+    if dtype.kind == "i":
+        return keys ^ sign
+    return np.where(keys & sign, ~keys, keys | sign)
+
+
+def radix_sort_numpy(input_array):
+    """
+    A function that performs LSD radix sort on a NumPy integer or float array
+    Uses byte-sized digits (base 256), one stable counting pass per byte, over
+    order-preserving unsigned keys of the values' bit patterns
+    Arguments:
+        input_array: A 1-d NumPy array of any integer or float dtype
+    Time complexity:
+        O(b*n), where b is the number of bytes needed for the difference
+        between the largest and smallest keys. Passes where every element has
+        the same byte are skipped.
+    Space complexity:
+        O(n), for the keys and the permuted copies of each pass.
+    Return: A new sorted NumPy array with the same dtype as input_array. NaNs
+            with the sign bit clear come last
+    """
+
+    if input_array.size == 0:
+        return input_array.copy()
+
+    # A vectorised min offset keeps keys that straddle the sign bit to the bytes they span
+    keys = numpy_keys(input_array)
+    keys = keys - keys.min()
+    output_array = input_array.copy()
+
+    max_key = int(keys.max())
+    shift = 0
+    while max_key >> shift:
+        digit = ((keys >> keys.dtype.type(shift)) & keys.dtype.type(255)).astype(np.uint8)
+
+        # Every element shares this byte, so the pass would not move anything
+        if np.bincount(digit, minlength=256).max() != keys.size:
+            # A stable argsort of uint8 digits is a counting scatter in NumPy
+            order = np.argsort(digit, kind="stable")
+            keys = keys[order]
+            output_array = output_array[order]
+
+        shift = shift + 8
+
+    return output_array
+
+
 def radix_sort(input_list, base):
+    if np is not None and isinstance(input_list, np.ndarray) and input_list.dtype.kind in "iuf":
+        return radix_sort_numpy(input_list)
+
     n = len(input_list)
+
+    typecode = None
+    if isinstance(input_list, array) and input_list.typecode in FLOAT_TYPECODES:
+        typecode = input_list.typecode
+    elif any(type(val) is float for val in input_list):
+        if not all(type(val) is float for val in input_list):
+            # float64 keys would round integers above 2**53, so a stable comparison sort is used
+            return merge_sort(list(input_list))
+        typecode = "d"
+
+    if typecode is not None:
+        if np is not None and n >= NUMPY_THRESHOLD:
+            dtype = np.float32 if typecode == "f" else np.float64
+            return radix_sort_numpy(np.array(input_list, dtype=dtype)).tolist()
+
+        keys = float_keys(input_list, typecode)
+        for col in range(digit_count(min(keys), max(keys), base)):
+            keys = counting_sort(keys, col, base)
+        return float_values(keys, typecode)
+
     max_val = max(input_list)
     min_val = min(input_list)
 
-    digits = 0
-    while max_val > 0:
-        max_val = max_val // base
-        digits = digits + 1
+    if np is not None and n >= NUMPY_THRESHOLD and INT64_MIN <= min_val and max_val <= INT64_MAX:
+        return radix_sort_numpy(np.array(input_list, dtype=np.int64)).tolist()
 
+    # The copy and the min offset for negatives are a single pass
+    offset = min(min_val, 0)
     output_list = []
     for val in input_list:
-        output_list.append(val)
-
-    has_negative = False
-    if min_val < 0:
-        has_negative = True
-        for i in range(n):
-            output_list[i] = output_list[i] - min_val
+        output_list.append(val - offset)
 
-    for col in range(digits):
+    for col in range(digit_count(min_val - offset, max_val - offset, base)):
         output_list = counting_sort(output_list, col, base)
 
-    if has_negative:
+    if offset:
         for i in range(n):
-            output_list[i] = output_list[i] + min_val
+            output_list[i] = output_list[i] + offset
 
     return output_list
@@ -0,0 +1,199 @@
+"""
+Author:     Chan Guan Yu
+Algorithm:  Sorting
+Name:       Cooperative Asyncio Sorts (Merge Sort and Heap Sort)
+Stability:  Merge Sort is Stable, Heap Sort is Unstable
+"""
+
+
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import heap_sort
+import merge_sort_iterative
+from typed_buffer import copy_of, empty_like
+
+
+# Seconds of sorting between two yields to the event loop
+TIME_BUDGET = 0.005
+
+# Elements merged between two checks of the clock
+STEP_SIZE = 1024
+
+# Inputs at least this long are handed to the executor, when one is given
+OFFLOAD_THRESHOLD = 1 << 20
+
+
+def merge_steps(input_list, temp_list, start, mid, end, step_size=STEP_SIZE):
+    # merge_sort_iterative.merge, pausing every step_size elements
+    i, k = start, start
+    j = mid + 1
+
+    while i <= mid and j <= end:
+        stop = min(k + step_size, end + 1)
+        while k < stop and i <= mid and j <= end:
+            if input_list[i] <= input_list[j]:
+                temp_list[k] = input_list[i]
+                i = i + 1
+            else:
+                temp_list[k] = input_list[j]
+                j = j + 1
+            k = k + 1
+        yield
+
+    # Only one side has elements left, they are copied in blocks
+    if i > mid:
+        i, mid = j, end
+    while i <= mid:
+        count = min(step_size, mid + 1 - i)
+        temp_list[k:k + count] = input_list[i:i + count]
+        i = i + count
+        k = k + count
+        yield
+
+    # input_list is only written here, so a paused merge leaves it unchanged
+    copied = start
+    try:
+        while copied <= end:
+            stop = min(copied + step_size, end + 1)
+            input_list[copied:stop] = temp_list[copied:stop]
+            copied = stop
+            yield
+    finally:
+        # A cancelled sort still leaves every element in input_list
+        input_list[copied:end + 1] = temp_list[copied:end + 1]
+
+
+def merge_sort_steps(input_list, step_size=STEP_SIZE):
+    # merge_sort_iterative.merge_sort as a generator, pausing about every step_size elements merged
+    n = len(input_list)
+    if n <= 1:
+        return
+
+    last_index = n - 1
+    temp_list = empty_like(input_list, n)
+    merged = 0
+
+    size = 1
+    while size < n:
+        start = 0
+        while start < n:
+            mid = min(start + size - 1, last_index)
+            end = min(mid + size, last_index)
+
+            if end - start + 1 <= step_size:
+                merge_sort_iterative.merge(input_list, temp_list, start, mid, end)
+                merged = merged + end - start + 1
+                if merged >= step_size:
+                    merged = 0
+                    yield
+            else:
+                yield from merge_steps(input_list, temp_list, start, mid, end, step_size)
+
+            start = start + size * 2
+        size = size * 2
+
+
+def heap_sort_steps(input_list):
+    # heap_sort.heap_sort as a generator, pausing after every heapify call
+    # A sift down of a large heap takes far longer than a clock read
+    n = len(input_list)
+
+    for i in range(n // 2 - 1, -1, -1):
+        heap_sort.heapify(input_list, n, i)
+        yield
+
+    for i in range(n - 1, 0, -1):
+        input_list[i], input_list[0] = input_list[0], input_list[i]
+        heap_sort.heapify(input_list, i, 0)
+        yield
+
+
+async def run_steps(steps, time_budget):
+    # Runs a step generator, awaiting once every time_budget seconds of work
+    deadline = time.perf_counter() + time_budget
+    try:
+        for _ in steps:
+            if time.perf_counter() >= deadline:
+                await asyncio.sleep(0)
+                deadline = time.perf_counter() + time_budget
+    finally:
+        # On cancellation, lets the step in progress put back what it holds
+        steps.close()
+
+
+async def offload(executor, sort, input_list):
+    # Sorts a copy in the executor, so a cancelled sort never writes to input_list later
+    if isinstance(executor, ProcessPoolExecutor):
+        work = input_list
+    else:
+        work = copy_of(input_list)
+
+    output_list = await asyncio.get_running_loop().run_in_executor(executor, sort, work)
+    input_list[:] = output_list
+
+
+async def merge_sort_async(input_list, time_budget=TIME_BUDGET, executor=None,
+                           offload_threshold=OFFLOAD_THRESHOLD):
+    """
+    A function that performs iterative merge sort in place without blocking
+    the event loop
+    Merges in bounded steps and awaits once every time_budget seconds, so
+    other coroutines run in between. Large merges are paused part way, and
+    input_list is only written by the copy back of each merge
+    Arguments:
+        input_list: A list, array.array, memoryview or NumPy array to be
+                    sorted in place
+        time_budget: A float which is the number of seconds of sorting
+                     between two yields to the event loop
+        executor: A concurrent.futures executor, inputs of at least
+                  offload_threshold elements are sorted in it. A process
+                  executor avoids competing with the event loop for the GIL
+        offload_threshold: An integer which is the smallest input handed to
+                           executor
+    Time complexity:
+        O(n*log(n)), plus one clock read every STEP_SIZE elements merged.
+    Space complexity:
+        O(n), for the auxiliary buffer, or the copy sorted by the executor.
+    Return: The input list, sorted. If the task is cancelled, input_list
+            still holds every element, partially sorted
+    """
+
+    if executor is not None and len(input_list) >= offload_threshold:
+        await offload(executor, merge_sort_iterative.merge_sort, input_list)
+    else:
+        await run_steps(merge_sort_steps(input_list), time_budget)
+    return input_list
+
+
+async def heap_sort_async(input_list, time_budget=TIME_BUDGET, executor=None,
+                          offload_threshold=OFFLOAD_THRESHOLD):
+    """
+    A function that performs heap sort in place without blocking the event loop
+    Every heapify call is a complete step, so the sort can pause after any
+    of them and awaits once every time_budget seconds
+    Arguments:
+        input_list: A list, array.array, memoryview or NumPy array to be
+                    sorted in place
+        time_budget: A float which is the number of seconds of sorting
+                     between two yields to the event loop
+        executor: A concurrent.futures executor, inputs of at least
+                  offload_threshold elements are sorted in it. A process
+                  executor avoids competing with the event loop for the GIL
+        offload_threshold: An integer which is the smallest input handed to
+                           executor
+    Time complexity:
+        O(n*log(n)), plus one clock read per heapify call.
+    Space complexity:
+        O(log(n)) for the recursion of heapify, or O(n) for the copy sorted
+        by the executor.
+    Return: The input list, sorted. If the task is cancelled, input_list
+            still holds every element, partially sorted
+    """
+
+    if executor is not None and len(input_list) >= offload_threshold:
+        await offload(executor, heap_sort.heap_sort, input_list)
+    else:
+        await run_steps(heap_sort_steps(input_list), time_budget)
+    return input_list
@@ -0,0 +1,316 @@
+"""
+Author:     Chan Guan Yu
+Algorithm:  Benchmark
+Name:       Sorting Benchmark Suite
+"""
+
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from keyed_sort import SORTS, INTEGER_SORTS
+from string_sort import STRING_SORTS
+
+
+DEFAULT_SIZES = [100, 1000, 10000]
+DEFAULT_REPEATS = 3
+DEFAULT_SEED = 12345
+DEFAULT_THRESHOLD = 0.10
+
+# Sorts that move elements through new lists or a separate buffer, so CountedList
+# only sees some of their writes, their write count is reported as None
+UNOBSERVED_WRITES = {
+    "heap_sort_dary",
+    "merge_sort",
+    "merge_sort_buffered",
+    "quick_sort_outofplace",
+    "counting_sort",
+    "radix_sort",
+    "msd_radix_sort",
+}
+
+# O(n**2) sorts are skipped above this size
+QUADRATIC_SORTS = {"bubble_sort", "insertion_sort", "selection_sort"}
+QUADRATIC_LIMIT = 5000
+
+
+def shape_random(n, rng):
+    return [rng.randrange(n * 4) for _ in range(n)]
+
+
+def shape_sorted(n, rng):
+    return list(range(n))
+
+
+def shape_reversed(n, rng):
+    return list(range(n, 0, -1))
+
+
+def shape_few_uniques(n, rng):
+    return [rng.randrange(8) for _ in range(n)]
+
+
+def shape_organ_pipe(n, rng):
+    half = n // 2
+    return list(range(half)) + list(range(n - half, 0, -1))
+
+
+def shape_sawtooth(n, rng):
+    tooth = max(1, int(n ** 0.5))
+    return [i % tooth for i in range(n)]
+
+
+def shape_duplicates_heavy(n, rng):
+    distinct = max(1, n // 10)
+    return [rng.randrange(distinct) for _ in range(n)]
+
+
+def shape_strings(n, rng):
+    # URL-like keys, long shared prefixes with a short distinguishing tail
+    hosts = ["https://example.com/", "https://api.example.com/", "https://cdn.example.org/"]
+    paths = ["users/", "orders/items/", "static/images/thumbnails/", "v1/search?q="]
+    return [rng.choice(hosts) + rng.choice(paths) + str(rng.randrange(n * 4)) for _ in range(n)]
+
+
+SHAPES = {
+    "random": shape_random,
+    "sorted": shape_sorted,
+    "reversed": shape_reversed,
+    "few_uniques": shape_few_uniques,
+    "organ_pipe": shape_organ_pipe,
+    "sawtooth": shape_sawtooth,
+    "duplicates_heavy": shape_duplicates_heavy,
+    "strings": shape_strings,
+}
+
+# Shapes of str keys, integer sorts cannot take them and only they are given to string sorts
+STRING_SHAPES = {"strings"}
+
+
+class CountedItem:
+    """
+    A class which wraps a value and counts every comparison made on it
+    """
+
+    __slots__ = ("val",)
+    comparisons = 0
+
+    def __init__(self, val):
+        """
+        Initialization of instance variables
+        """
+
+        self.val = val
+
+    def __lt__(self, other):
+        CountedItem.comparisons = CountedItem.comparisons + 1
+        return self.val < other.val
+
+    def __le__(self, other):
+        CountedItem.comparisons = CountedItem.comparisons + 1
+        return self.val <= other.val
+
+    def __gt__(self, other):
+        CountedItem.comparisons = CountedItem.comparisons + 1
+        return self.val > other.val
+
+    def __ge__(self, other):
+        CountedItem.comparisons = CountedItem.comparisons + 1
+        return self.val >= other.val
+
+    def __eq__(self, other):
+        CountedItem.comparisons = CountedItem.comparisons + 1
+        return self.val == other.val
+
+
+class CountedList(list):
+    """
+    A class which counts every element write made on the list in place
+    A swap counts as two writes
+    """
+
+    writes = 0
+
+    def __setitem__(self, index, val):
+        if isinstance(index, slice):
+            CountedList.writes = CountedList.writes + len(range(*index.indices(len(self))))
+        else:
+            CountedList.writes = CountedList.writes + 1
+        list.__setitem__(self, index, val)
+
+
+def time_sort(sort_function, data, repeats):
+    best = None
+    for _ in range(repeats):
+        input_list = list(data)
+        start = time.perf_counter()
+        sort_function(input_list)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def peak_memory(sort_function, data):
+    input_list = list(data)
+    tracemalloc.start()
+    try:
+        sort_function(input_list)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def count_operations(algorithm, sort_function, data):
+    # Integer and string sorts look inside the elements, so they cannot be wrapped
+    if algorithm in INTEGER_SORTS or algorithm in STRING_SORTS:
+        input_list = CountedList(data)
+        comparisons = None
+    else:
+        input_list = CountedList(CountedItem(val) for val in data)
+        comparisons = 0
+
+    CountedItem.comparisons = 0
+    CountedList.writes = 0
+    output_list = sort_function(input_list)
+
+    if comparisons is not None:
+        comparisons = CountedItem.comparisons
+
+    # A sort that returns a new list did not write its result into input_list
+    writes = CountedList.writes
+    if algorithm in UNOBSERVED_WRITES or output_list is not input_list:
+        writes = None
+    return comparisons, writes
+
+
+def run_benchmark(algorithms=None, shapes=None, sizes=None, repeats=DEFAULT_REPEATS, seed=DEFAULT_SEED):
+    """
+    A function that runs every algorithm over a matrix of sizes and input shapes
+    Each input is generated from a fixed seed, so runs are reproducible
+    Arguments:
+        algorithms: A list of algorithm names from keyed_sort.SORTS or
+                    string_sort.STRING_SORTS, defaults to all
+        shapes: A list of shape names from SHAPES, defaults to all
+        sizes: A list of integers which are the input sizes
+        repeats: An integer which is the number of timed runs, the fastest is kept
+        seed: An integer which seeds the input generator
+    Time complexity:
+        The sum of the time complexities of the algorithms over every input,
+        times repeats + 2 for the memory and operation-count runs.
+    Space complexity:
+        O(n), for one input and its copies at a time.
+    Return: A dictionary with the run metadata and a list of results
+    """
+
+    algorithms = list(SORTS) + list(STRING_SORTS) if algorithms is None else algorithms
+    shapes = list(SHAPES) if shapes is None else shapes
+    sizes = DEFAULT_SIZES if sizes is None else sizes
+
+    results = []
+    for shape in shapes:
+        for size in sizes:
+            data = SHAPES[shape](size, random.Random(seed))
+
+            for algorithm in algorithms:
+                if algorithm in QUADRATIC_SORTS and size > QUADRATIC_LIMIT:
+                    continue
+                if shape in STRING_SHAPES and algorithm in INTEGER_SORTS:
+                    continue
+                if shape not in STRING_SHAPES and algorithm in STRING_SORTS:
+                    continue
+
+                result = {"algorithm": algorithm, "shape": shape, "size": size}
+                sort_function = STRING_SORTS[algorithm] if algorithm in STRING_SORTS else SORTS[algorithm]
+
+                # The recursive quick sorts can exceed the recursion limit on sorted input
+                try:
+                    result["time"] = time_sort(sort_function, data, repeats)
+                    result["peak_memory"] = peak_memory(sort_function, data)
+                    result["comparisons"], result["writes"] = count_operations(algorithm, sort_function, data)
+                except RecursionError:
+                    result["error"] = "RecursionError"
+
+                results.append(result)
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "repeats": repeats,
+        "results": results,
+    }
+
+
+def compare_to_baseline(report, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    A function that flags results which got slower than a baseline report
+    Arguments:
+        report: A dictionary returned by run_benchmark()
+        baseline: A dictionary returned by an earlier run_benchmark()
+        threshold: A float, a result is flagged when its time exceeds the
+                   baseline time by more than this fraction
+    Time complexity:
+        O(r), where r is the number of results.
+    Space complexity:
+        O(r), for the baseline lookup table.
+    Return: A list of dictionaries, one per regression
+    """
+
+    baseline_times = {}
+    for result in baseline["results"]:
+        if "time" in result:
+            baseline_times[(result["algorithm"], result["shape"], result["size"])] = result["time"]
+
+    regressions = []
+    for result in report["results"]:
+        case = (result["algorithm"], result["shape"], result["size"])
+        if "time" not in result or case not in baseline_times:
+            continue
+
+        old_time = baseline_times[case]
+        if old_time > 0 and result["time"] > old_time * (1 + threshold):
+            regressions.append({
+                "algorithm": result["algorithm"],
+                "shape": result["shape"],
+                "size": result["size"],
+                "baseline_time": old_time,
+                "time": result["time"],
+                "ratio": result["time"] / old_time,
+            })
+
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark every sort in the repo")
+    parser.add_argument("--algorithms", nargs="+", choices=list(SORTS) + list(STRING_SORTS))
+    parser.add_argument("--shapes", nargs="+", choices=list(SHAPES))
+    parser.add_argument("--sizes", nargs="+", type=int)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--output", default="bench_output.json")
+    parser.add_argument("--baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    report = run_benchmark(args.algorithms, args.shapes, args.sizes, args.repeats, args.seed)
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+
+    if args.baseline is not None:
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)
+
+        regressions = compare_to_baseline(report, baseline, args.threshold)
+        for regression in regressions:
+            print("REGRESSION " + regression["algorithm"] + " " + regression["shape"] + " " +
+                  str(regression["size"]) + ": " + "{:.2f}".format(regression["ratio"]) + "x baseline")
+
+        if regressions:
+            sys.exit(1)
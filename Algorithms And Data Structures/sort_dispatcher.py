@@ -0,0 +1,276 @@
+"""
+Author:     Chan Guan Yu
+Algorithm:  Sorting
+Name:       Automatic Sort Dispatcher
+Stability:  Stable when stable=True
+"""
+
+
+from keyed_sort import SORTS, STABLE_SORTS, INTEGER_SORTS, argsort
+from string_sort import STRING_SORTS, STABLE_STRING_SORTS
+
+SAMPLE_SIZE = 1024
+
+# Quick sorts whose recursion depth grows with n on sorted or patterned input,
+# a benchmark win at small sizes says nothing about the recursion limit
+RECURSIVE_SORTS = {"quick_sort_hoare", "quick_sort_lomuto", "quick_sort_dutch", "quick_sort_outofplace"}
+
+# Thresholds, and the algorithm used for each class of input
+# Any entry can be overridden by passing a cost_model to sort() or choose()
+# The string sorts measured slower than comparison sorts on URL-like keys, so
+# they are only chosen when a benchmark cost model picks them
+DEFAULT_COST_MODEL = {
+    "small_n": 32,
+    "counting_range_factor": 2,
+    "radix_min_n": 256,
+    "presorted_fraction": 0.9,
+    "duplicate_ratio": 0.5,
+    "small": "insertion_sort",
+    "dense_int": "counting_sort",
+    "wide_int": "radix_sort",
+    "presorted": "merge_sort_adaptive",
+    "stable": "merge_sort_adaptive",
+    "duplicates": "introsort_dutch",
+    "random": "quick_sort_dual_pivot",
+    "string": "quick_sort_dual_pivot",
+    "stable_string": "merge_sort_adaptive",
+}
+
+# Benchmark shapes that stand for each class of input
+BENCHMARK_SHAPES = {
+    "presorted": ["sorted", "reversed", "organ_pipe"],
+    "duplicates": ["few_uniques", "duplicates_heavy"],
+    "random": ["random"],
+    "stable": ["random"],
+    "string": ["strings"],
+    "stable_string": ["strings"],
+}
+
+
+def profile_input(keys, sample_size=SAMPLE_SIZE):
+    """
+    A function that cheaply describes the keys to be sorted
+    Looks at an evenly spaced sample, except for the integer range, which
+    is exact so counting sort is never given a value outside it
+    Arguments:
+        keys: A list of keys
+        sample_size: An integer which is the number of keys sampled
+    Time complexity:
+        O(s) for a sample of s keys, plus O(n) when the keys are integers.
+    Space complexity:
+        O(s), for the sample.
+    Return: A dictionary with n, element_type, runs, ascending_fraction,
+            descending_fraction, duplicate_ratio, and min_key / max_key
+            for integer keys
+    """
+
+    n = len(keys)
+    step = max(1, n // sample_size)
+    sample = keys[::step][:sample_size]
+
+    types = set(type(k) for k in sample)
+    if len(types) == 1:
+        element_type = types.pop().__name__
+    elif types and types <= {int, float}:
+        element_type = "float"
+    else:
+        element_type = "mixed"
+
+    # The sample is only a hint, integer sorts need every key to be an int
+    if element_type == "int" and not all(type(k) is int for k in keys):
+        element_type = "mixed"
+
+    ascending, descending = 0, 0
+    for i in range(1, len(sample)):
+        if sample[i - 1] <= sample[i]:
+            ascending = ascending + 1
+        if sample[i] <= sample[i - 1]:
+            descending = descending + 1
+    pairs = max(1, len(sample) - 1)
+
+    try:
+        duplicate_ratio = 1 - len(set(sample)) / max(1, len(sample))
+    except TypeError:
+        duplicate_ratio = 0.0
+
+    profile = {
+        "n": n,
+        "element_type": element_type,
+        "runs": len(sample) - ascending,
+        "ascending_fraction": ascending / pairs,
+        "descending_fraction": descending / pairs,
+        "duplicate_ratio": duplicate_ratio,
+    }
+
+    if element_type == "int" and n > 0:
+        profile["min_key"] = min(keys)
+        profile["max_key"] = max(keys)
+
+    return profile
+
+
+def stable_choice(model, stable, algorithm, reason):
+    # An overridden entry may name an unstable sort, stable order then takes model["stable"]
+    if stable and algorithm not in STABLE_SORTS and algorithm not in STABLE_STRING_SORTS:
+        return model["stable"], reason + ", " + algorithm + " is unstable"
+    return algorithm, reason
+
+
+def choose_algorithm(profile, stable=False, cost_model=None):
+    """
+    A function that picks an algorithm for a profiled input
+    Arguments:
+        profile: A dictionary returned by profile_input()
+        stable: A Boolean value, if True, only stable algorithms are chosen
+        cost_model: A dictionary overriding entries of DEFAULT_COST_MODEL
+    Time complexity:
+        O(1)
+    Space complexity:
+        O(1)
+    Return: A tuple (algorithm name, reason)
+    """
+
+    model = dict(DEFAULT_COST_MODEL)
+    if cost_model is not None:
+        model.update(cost_model)
+
+    n = profile["n"]
+    element_type = profile["element_type"]
+
+    if n <= model["small_n"]:
+        return stable_choice(model, stable, model["small"],
+                             "n = " + str(n) + " is at most small_n = " + str(model["small_n"]))
+
+    if element_type == "int":
+        key_range = profile["max_key"] - profile["min_key"] + 1
+        if key_range <= model["counting_range_factor"] * n:
+            return stable_choice(model, stable, model["dense_int"],
+                                 "integer key range " + str(key_range) + " is dense for n = " + str(n))
+        if n >= model["radix_min_n"]:
+            return stable_choice(model, stable, model["wide_int"],
+                                 "integer keys with range " + str(key_range) + " and n = " + str(n))
+
+    if profile["ascending_fraction"] >= model["presorted_fraction"] or \
+            profile["descending_fraction"] >= model["presorted_fraction"]:
+        fraction = max(profile["ascending_fraction"], profile["descending_fraction"])
+        return stable_choice(model, stable, model["presorted"],
+                             "sample is " + "{:.0%}".format(fraction) + " presorted")
+
+    if element_type in ("str", "bytes"):
+        if stable:
+            return model["stable_string"], element_type + " keys, stable order required"
+        return model["string"], element_type + " keys"
+
+    if profile["duplicate_ratio"] >= model["duplicate_ratio"]:
+        return stable_choice(model, stable, model["duplicates"],
+                             "sample is " + "{:.0%}".format(profile["duplicate_ratio"]) + " duplicates")
+
+    if stable:
+        return model["stable"], "stable order required"
+
+    return model["random"], "no exploitable structure found"
+
+
+def choose(data, stable=False, key=None, cost_model=None):
+    """
+    A function that shows which algorithm sort() would use, and why
+    Arguments:
+        data: An iterable to be sorted
+        stable: A Boolean value, if True, only stable algorithms are chosen
+        key: A function that extracts the comparison key from an element
+        cost_model: A dictionary overriding entries of DEFAULT_COST_MODEL
+    Time complexity:
+        O(n) to extract the keys, plus the cost of profile_input().
+    Space complexity:
+        O(n), for the keys.
+    Return: A dictionary with the chosen algorithm, the reason and the profile
+    """
+
+    keys = list(data) if key is None else [key(element) for element in data]
+    profile = profile_input(keys)
+    algorithm, reason = choose_algorithm(profile, stable, cost_model)
+    return {"algorithm": algorithm, "reason": reason, "profile": profile}
+
+
+def sort(data, stable=False, key=None, cost_model=None):
+    """
+    A function that sorts data with the algorithm best suited to it
+    Profiles the keys for length, presortedness, element type, integer
+    range and duplicates, then routes to counting sort, radix sort, the
+    adaptive merge sort, a string sort or a quick sort variant
+    Arguments:
+        data: An iterable to be sorted, it is not modified
+        stable: A Boolean value, if True, only stable algorithms are chosen
+        key: A function that extracts the comparison key from an element,
+             each key is computed once
+        cost_model: A dictionary overriding entries of DEFAULT_COST_MODEL
+    Time complexity:
+        The time complexity of the chosen algorithm, plus O(n) for profiling.
+    Space complexity:
+        O(n), for the copy that is sorted.
+    Return: A new sorted list
+    """
+
+    data = list(data)
+    if key is None:
+        algorithm = choose(data, stable, None, cost_model)["algorithm"]
+        if algorithm in STRING_SORTS:
+            return STRING_SORTS[algorithm](data)
+        return SORTS[algorithm](data)
+
+    keys = [key(element) for element in data]
+    algorithm, reason = choose_algorithm(profile_input(keys), stable, cost_model)
+
+    # Decorated keys are tuples, which string sorts cannot take
+    if algorithm in STRING_SORTS:
+        algorithm = DEFAULT_COST_MODEL["stable"]
+    return [data[i] for i in argsort(keys, algorithm)]
+
+
+def cost_model_from_benchmark(report, size=None):
+    """
+    A function that builds a cost model from sort_benchmark results
+    For each class of input, picks the fastest algorithm on the benchmark
+    shapes that stand for it, at the given size. The recursive quick sorts,
+    and any algorithm that failed on some shape at that size, are never
+    picked, as a class is only scored on its own shapes
+    Arguments:
+        report: A dictionary returned by sort_benchmark.run_benchmark()
+        size: An integer which is the benchmark size to use, defaults to
+              the largest size in the report
+    Time complexity:
+        O(r), where r is the number of results.
+    Space complexity:
+        O(r)
+    Return: A dictionary that can be passed as cost_model
+    """
+
+    results = [result for result in report["results"] if "time" in result]
+    if size is None:
+        size = max(result["size"] for result in results)
+
+    failed = set(result["algorithm"] for result in report["results"]
+                 if "error" in result and result["size"] == size)
+
+    cost_model = {}
+    for input_class, shapes in BENCHMARK_SHAPES.items():
+        totals = {}
+        for result in results:
+            if result["size"] != size or result["shape"] not in shapes:
+                continue
+            if result["algorithm"] in INTEGER_SORTS or result["algorithm"] in RECURSIVE_SORTS or \
+                    result["algorithm"] in failed:
+                continue
+            if input_class in ("stable", "stable_string") and \
+                    result["algorithm"] not in STABLE_SORTS and result["algorithm"] not in STABLE_STRING_SORTS:
+                continue
+            totals[result["algorithm"]] = totals.get(result["algorithm"], 0) + result["time"]
+
+        # Only algorithms that finished every shape of the class can be chosen
+        complete = [name for name in totals
+                    if sum(1 for r in results if r["algorithm"] == name and r["size"] == size and
+                           r["shape"] in shapes) == len(shapes)]
+        if complete:
+            cost_model[input_class] = min(complete, key=lambda name: totals[name])
+
+    return cost_model
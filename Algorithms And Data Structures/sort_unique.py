@@ -0,0 +1,109 @@
+"""
+Author:     Chan Guan Yu
+Algorithm:  Sorting
+Name:       Sort-Unique and Group Counts (Dutch National Flag)
+Stability:  Unstable
+"""
+
+
+from heap_sort import heap_sort
+from insertion_sort import insertion_sort
+from introsort import choose_pivot, partition_dutch
+
+
+# Ranges of this size or smaller are finished with insertion sort and a run scan
+INSERTION_THRESHOLD = 16
+
+
+def count_runs(input_list, low, high):
+    # Yields (key, count) for each run of equal elements in the sorted range
+    start = low
+    for i in range(low + 1, high + 1):
+        if input_list[i] != input_list[start]:
+            yield input_list[start], i - start
+            start = i
+    yield input_list[start], high + 1 - start
+
+
+def sorted_runs(data):
+    """
+    A function that yields the distinct keys of data with their counts, in
+    sorted order
+    Quick sort with a Dutch national flag partition, where the block equal to
+    the pivot is counted as soon as it is found and never partitioned again,
+    so each distinct key is a pivot at most once. Ranges are visited in
+    order, left side, equal block, right side, so runs come out sorted
+    Arguments:
+        data: An iterable of mutually comparable elements, it is not modified
+    Time complexity:
+        O(n*log(d)) expected, where d is the number of distinct keys, and
+        O(n*log(n)) in the worst case, as ranges still being partitioned
+        after 2 * log2(n) levels are heap sorted.
+    Space complexity:
+        O(n), for the copy of data, plus O(log(n)) for the explicit stack.
+    Return: A generator of (key, count) tuples in ascending key order
+    """
+
+    input_list = list(data)
+    n = len(input_list)
+    if n == 0:
+        return
+
+    # Entries are (low, high, depth), or (low, high, None) for a block of equal keys
+    stack = [(0, n - 1, 2 * n.bit_length())]
+
+    while stack:
+        low, high, depth = stack.pop()
+
+        if depth is None:
+            yield input_list[low], high - low + 1
+            continue
+
+        if high - low + 1 <= INSERTION_THRESHOLD or depth == 0:
+            # Too many bad pivots, fall back to heap sort for this range
+            if depth == 0:
+                heap_sort(input_list, low, high)
+            else:
+                insertion_sort(input_list, low, high)
+            yield from count_runs(input_list, low, high)
+            continue
+
+        boundary1, boundary2 = partition_dutch(input_list, low, high, choose_pivot(input_list, low, high))
+
+        # The left side is popped first and the right side last
+        if boundary2 < high:
+            stack.append((boundary2 + 1, high, depth - 1))
+        stack.append((boundary1, boundary2, None))
+        if low < boundary1:
+            stack.append((low, boundary1 - 1, depth - 1))
+
+
+def sort_unique(data):
+    """
+    A function that returns the distinct elements of data in sorted order
+    Arguments:
+        data: An iterable of mutually comparable elements, it is not modified
+    Time complexity:
+        O(n*log(d)) expected, where d is the number of distinct keys.
+    Space complexity:
+        O(n)
+    Return: A sorted list of the distinct elements, one element of each
+            group of equal elements is kept
+    """
+
+    return [key for key, count in sorted_runs(data)]
+
+
+def sort_counts(data):
+    """
+    A function that counts each distinct element of data, in sorted order
+    Arguments:
+        data: An iterable of mutually comparable elements, it is not modified
+    Time complexity:
+        O(n*log(d)) expected, where d is the number of distinct keys.
+    Space complexity:
+        O(n)
+    Return: A list of (key, count) tuples in ascending key order
+    """
+
+    return list(sorted_runs(data))
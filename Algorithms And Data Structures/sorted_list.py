@@ -0,0 +1,309 @@
+"""
+Author:     Chan Guan Yu
+Algorithm:  Data Structure
+Name:       Sorted List (Bucketed)
+"""
+
+
+from binary_search import lower_bound, upper_bound
+from merge_sort_adaptive import merge_sort
+
+
+DEFAULT_LOAD = 1000
+
+
+class SortedList:
+    """
+    A class which represents a list that is kept sorted as values are added
+    Values live in a list of sorted sublists of about load elements each,
+    with the maximum of every sublist kept alongside for binary search, so an
+    insert only shifts the elements of one sublist
+    """
+
+    __slots__ = ("load", "lists", "maxes", "offsets", "size")
+
+    def __init__(self, iterable=None, load=DEFAULT_LOAD):
+        """
+        Initialization of instance variables
+        Arguments:
+            iterable: An iterable of initial values
+            load: An integer which is the target sublist length, sublists are
+                  split at twice and merged below half of it
+        """
+
+        if load < 4:
+            raise ValueError("load must be at least 4")
+
+        self.load = load
+        self.lists = []
+        self.maxes = []
+        self.offsets = None
+        self.size = 0
+
+        if iterable is not None:
+            self.update(iterable)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        for sublist in self.lists:
+            yield from sublist
+
+    def __reversed__(self):
+        for i in range(len(self.lists) - 1, -1, -1):
+            yield from reversed(self.lists[i])
+
+    def __contains__(self, value):
+        i = lower_bound(self.maxes, value)
+        if i == len(self.maxes):
+            return False
+        sublist = self.lists[i]
+        j = lower_bound(sublist, value)
+        return sublist[j] == value
+
+    def __repr__(self):
+        return "SortedList(" + repr(list(self)) + ")"
+
+    def build_offsets(self):
+        # Positional index, the starting position of every sublist
+        # Rebuilt lazily after inserts and deletes, in O(n / load)
+        offsets = []
+        total = 0
+        for sublist in self.lists:
+            offsets.append(total)
+            total = total + len(sublist)
+        self.offsets = offsets
+
+    def locate(self, index):
+        # Maps a position to (sublist index, index within the sublist)
+        if index < 0:
+            index = index + self.size
+        if not 0 <= index < self.size:
+            raise IndexError("SortedList index out of range")
+
+        if self.offsets is None:
+            self.build_offsets()
+        i = upper_bound(self.offsets, index) - 1
+        return i, index - self.offsets[i]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.size))]
+
+        i, j = self.locate(index)
+        return self.lists[i][j]
+
+    def __delitem__(self, index):
+        i, j = self.locate(index)
+        self.delete(i, j)
+
+    def add(self, value):
+        """
+        A method that inserts a value, after any equal values already present
+        Time complexity:
+            O(log(n) + load), binary searches over the maxes and one sublist,
+            then a shift of at most 2 * load elements.
+        Space complexity:
+            O(1)
+        Return: N/A
+        """
+
+        if not self.lists:
+            self.lists.append([value])
+            self.maxes.append(value)
+        else:
+            i = upper_bound(self.maxes, value)
+            if i == len(self.maxes):
+                i = i - 1
+                self.lists[i].append(value)
+                self.maxes[i] = value
+            else:
+                sublist = self.lists[i]
+                sublist.insert(upper_bound(sublist, value), value)
+
+            if len(self.lists[i]) > 2 * self.load:
+                self.split(i)
+
+        self.size = self.size + 1
+        self.offsets = None
+
+    def split(self, i):
+        sublist = self.lists[i]
+        half = len(sublist) // 2
+        self.lists[i:i + 1] = [sublist[:half], sublist[half:]]
+        self.maxes[i:i + 1] = [sublist[half - 1], sublist[-1]]
+
+    def delete(self, i, j):
+        sublist = self.lists[i]
+        del sublist[j]
+        self.size = self.size - 1
+        self.offsets = None
+
+        if not sublist:
+            del self.lists[i]
+            del self.maxes[i]
+            return
+
+        self.maxes[i] = sublist[-1]
+
+        # Merge a sublist that has shrunk below half the load into a neighbour
+        if len(sublist) < self.load // 2 and len(self.lists) > 1:
+            if i == 0:
+                i = 1
+            self.lists[i - 1].extend(self.lists[i])
+            self.maxes[i - 1] = self.maxes[i]
+            del self.lists[i]
+            del self.maxes[i]
+
+            if len(self.lists[i - 1]) > 2 * self.load:
+                self.split(i - 1)
+
+    def discard(self, value):
+        """
+        A method that removes one occurrence of value, if present
+        Time complexity:
+            O(log(n) + load)
+        Space complexity:
+            O(1)
+        Return: A Boolean value, True if a value was removed
+        """
+
+        i = lower_bound(self.maxes, value)
+        if i == len(self.maxes):
+            return False
+
+        j = lower_bound(self.lists[i], value)
+        if self.lists[i][j] != value:
+            return False
+
+        self.delete(i, j)
+        return True
+
+    def remove(self, value):
+        if not self.discard(value):
+            raise ValueError(repr(value) + " is not in SortedList")
+
+    def pop(self, index=-1):
+        i, j = self.locate(index)
+        value = self.lists[i][j]
+        self.delete(i, j)
+        return value
+
+    def bisect_left(self, value):
+        """
+        A method that finds the position at which value would be inserted
+        before any equal values
+        Time complexity:
+            O(log(n)), binary searches over the maxes and one sublist.
+        Space complexity:
+            O(n / load), if the positional index has to be rebuilt.
+        Return: An integer position
+        """
+
+        i = lower_bound(self.maxes, value)
+        if i == len(self.maxes):
+            return self.size
+
+        if self.offsets is None:
+            self.build_offsets()
+        return self.offsets[i] + lower_bound(self.lists[i], value)
+
+    def bisect_right(self, value):
+        """
+        A method that finds the position at which value would be inserted
+        after any equal values
+        Time complexity:
+            O(log(n)), binary searches over the maxes and one sublist.
+        Space complexity:
+            O(n / load), if the positional index has to be rebuilt.
+        Return: An integer position
+        """
+
+        i = upper_bound(self.maxes, value)
+        if i == len(self.maxes):
+            return self.size
+
+        if self.offsets is None:
+            self.build_offsets()
+        return self.offsets[i] + upper_bound(self.lists[i], value)
+
+    def count(self, value):
+        return self.bisect_right(value) - self.bisect_left(value)
+
+    def index(self, value):
+        position = self.bisect_left(value)
+        if position == self.size or self[position] != value:
+            raise ValueError(repr(value) + " is not in SortedList")
+        return position
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True)):
+        """
+        A method that iterates over the values between minimum and maximum
+        Arguments:
+            minimum: The lower bound, defaults to no lower bound
+            maximum: The upper bound, defaults to no upper bound
+            inclusive: A tuple of two Boolean values, whether each bound
+                       is included
+        Time complexity:
+            O(log(n) + m), where m is the number of values yielded.
+        Space complexity:
+            O(1)
+        Return: A generator of values in sorted order
+        """
+
+        if not self.lists:
+            return
+
+        # Starting sublist and position
+        if minimum is None:
+            i, j = 0, 0
+        elif inclusive[0]:
+            i = lower_bound(self.maxes, minimum)
+            if i == len(self.maxes):
+                return
+            j = lower_bound(self.lists[i], minimum)
+        else:
+            i = upper_bound(self.maxes, minimum)
+            if i == len(self.maxes):
+                return
+            j = upper_bound(self.lists[i], minimum)
+
+        while i < len(self.lists):
+            sublist = self.lists[i]
+            while j < len(sublist):
+                value = sublist[j]
+                if maximum is not None:
+                    if maximum < value or (not inclusive[1] and not value < maximum):
+                        return
+                yield value
+                j = j + 1
+            i = i + 1
+            j = 0
+
+    def update(self, iterable):
+        """
+        A method that adds every value of iterable
+        Large batches are merged with the existing values and the sublists
+        are rebuilt, instead of inserting one value at a time
+        Time complexity:
+            O(n + m*log(m)) for a large batch of m values, as the existing
+            values form a single sorted run for the adaptive merge sort.
+            O(m*(log(n) + load)) for a small batch.
+        Space complexity:
+            O(n + m) for a large batch, O(1) for a small batch.
+        Return: N/A
+        """
+
+        values = list(iterable)
+        if len(values) * 4 < self.size:
+            for value in values:
+                self.add(value)
+            return
+
+        values = merge_sort(list(self) + values)
+        load = self.load
+        self.lists = [values[i:i + load] for i in range(0, len(values), load)]
+        self.maxes = [sublist[-1] for sublist in self.lists]
+        self.size = len(values)
+        self.offsets = None
@@ -0,0 +1,173 @@
+"""
+Author:     Chan Guan Yu
+Algorithm:  Sorting
+Name:       String Sorts (Multikey Quick Sort and MSD Radix Sort)
+Stability:  Multikey Quick Sort is Unstable, MSD Radix Sort is Stable
+"""
+
+
+from insertion_sort import insertion_sort
+
+
+# Ranges of this size or smaller are finished with insertion sort
+INSERTION_THRESHOLD = 16
+
+# MSD radix sort hands ranges with characters beyond this to multikey quick sort,
+# so the count array stays small
+MAX_RADIX = 1 << 16
+
+
+def char_at(key, d):
+    # Character code of key at position d, or -1 past the end, without slicing
+    # Indexing bytes gives an int, indexing str gives a one character string
+    if d < len(key):
+        c = key[d]
+        return c if type(c) is int else ord(c)
+    return -1
+
+
+def multikey_partition(input_list, low, high, d):
+    # Dutch national flag partition on the character at position d
+    mid = low + (high - low) // 2
+    a, b, c = char_at(input_list[low], d), char_at(input_list[mid], d), char_at(input_list[high], d)
+    if a < b:
+        pivot_index = mid if b < c else (high if a < c else low)
+    else:
+        pivot_index = low if a < c else (high if b < c else mid)
+
+    input_list[low], input_list[pivot_index] = input_list[pivot_index], input_list[low]
+    pivot = char_at(input_list[low], d)
+    i = low + 1
+
+    while i <= high:
+        c = char_at(input_list[i], d)
+        if c < pivot:
+            input_list[i], input_list[low] = input_list[low], input_list[i]
+            low = low + 1
+            i = i + 1
+        elif c > pivot:
+            input_list[i], input_list[high] = input_list[high], input_list[i]
+            high = high - 1
+        else:
+            i = i + 1
+
+    return low, high, pivot
+
+
+def multikey_quick_sort(input_list, low=0, high=None, d=0):
+    """
+    A function that performs Bentley-Sedgewick multikey (3-way radix) quick sort
+    Partitions on one character position at a time into less, equal and
+    greater ranges, and only the equal range moves on to the next position,
+    so shared prefixes are never compared twice
+    Arguments:
+        input_list: A list of str or a list of bytes
+        low: An integer which is the first index of the range to sort
+        high: An integer which is the last index of the range to sort,
+              defaults to the last index of the list
+        d: An integer which is the first character position to compare,
+           the keys in the range must already agree before it
+    Time complexity:
+        O(n*log(n) + D) expected, where D is the total length of the
+        distinguishing prefixes.
+    Space complexity:
+        O(log(n) + L), for the explicit stack, where L is the longest shared
+        prefix. No substrings are created.
+    Return: The input list, sorted
+    """
+
+    if high is None:
+        high = len(input_list) - 1
+
+    stack = [(low, high, d)]
+    while stack:
+        low, high, d = stack.pop()
+
+        # Whole keys can be compared directly, the first d characters are equal
+        if high - low + 1 <= INSERTION_THRESHOLD:
+            if low < high:
+                insertion_sort(input_list, low, high)
+            continue
+
+        boundary1, boundary2, pivot = multikey_partition(input_list, low, high, d)
+        stack.append((low, boundary1 - 1, d))
+        stack.append((boundary2 + 1, high, d))
+
+        # Keys that ended at position d are all equal, nothing left to sort
+        if pivot >= 0:
+            stack.append((boundary1, boundary2, d + 1))
+
+    return input_list
+
+
+def msd_radix_sort(input_list):
+    """
+    A function that performs MSD radix sort on strings or bytes
+    Distributes each range into buckets by the character at position d with
+    a counting pass, then sorts each bucket on position d + 1. Small buckets
+    are finished with insertion sort
+    Arguments:
+        input_list: A list of str or a list of bytes
+    Time complexity:
+        O(D + R*b), where D is the total length of the distinguishing
+        prefixes, R is the size of the count array of a pass and b is the
+        number of buckets larger than the cutoff.
+    Space complexity:
+        O(n + R), for the auxiliary buffer, reused by every pass, and the
+        count array. No substrings are created.
+    Return: The input list, sorted
+    """
+
+    n = len(input_list)
+    aux = [None] * n
+    stack = [(0, n - 1, 0)]
+
+    while stack:
+        low, high, d = stack.pop()
+
+        if high - low + 1 <= INSERTION_THRESHOLD:
+            if low < high:
+                insertion_sort(input_list, low, high)
+            continue
+
+        codes = [char_at(input_list[i], d) for i in range(low, high + 1)]
+        max_code = max(codes)
+
+        # A wide alphabet would need a huge count array, the first d characters are already equal
+        if max_code >= MAX_RADIX:
+            multikey_quick_sort(input_list, low, high, d)
+            continue
+
+        # Bucket 0 holds keys that end before position d
+        count_arr = [0] * (max_code + 3)
+        for c in codes:
+            count_arr[c + 2] = count_arr[c + 2] + 1
+        for r in range(1, len(count_arr)):
+            count_arr[r] = count_arr[r] + count_arr[r - 1]
+
+        # count_arr[c + 1] is now the start of bucket c, relative to low
+        for i in range(len(codes)):
+            c = codes[i] + 1
+            aux[count_arr[c]] = input_list[low + i]
+            count_arr[c] = count_arr[c] + 1
+        for i in range(len(codes)):
+            input_list[low + i] = aux[i]
+
+        # count_arr[c] is now the end of bucket c, keys that ended are already in order
+        for c in range(1, max_code + 2):
+            start = count_arr[c - 1]
+            end = count_arr[c] - 1
+            if end > start:
+                stack.append((low + start, low + end, d + 1))
+
+    return input_list
+
+
+# String sorts only accept str or bytes, so they are kept out of keyed_sort.SORTS
+STRING_SORTS = {
+    "multikey_quick_sort": multikey_quick_sort,
+    "msd_radix_sort": msd_radix_sort,
+}
+
+# String sorts that keep equal keys in their original order
+STABLE_STRING_SORTS = {"msd_radix_sort"}
@@ -9,6 +9,8 @@ import sys
 import random
 import math
 
+import instrumentation
+
 
 def mod_exp(base, exp, mod):
     """
@@ -50,6 +52,10 @@ def mod_exp(base, exp, mod):
         base = (base * base) % mod
         i = i + 1
 
+    if instrumentation.ENABLED:
+        # One squaring per bit, plus one multiplication into result per set bit
+        instrumentation.count("twin_prime_generator.mod_exp.multiplications", i + bin(og_exp).count("1"))
+
     return result
 
 
@@ -83,6 +89,8 @@ def miller_rabin(n, k=64):
         t = t//2
 
     for x in range(k):
+        if instrumentation.ENABLED:
+            instrumentation.count("twin_prime_generator.miller_rabin.witness_rounds")
 
         # Choose random number in the range 1 < a < n - 1
         a = random.randrange(2, n - 1)
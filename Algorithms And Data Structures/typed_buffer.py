@@ -0,0 +1,86 @@
+"""
+Author:     Chan Guan Yu
+Algorithm:  Memory
+Name:       Typed Auxiliary Buffers
+"""
+
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def empty_like(input_list, n=None):
+    """
+    A function that allocates auxiliary storage for a sort, of the same
+    element type as the sequence being sorted
+    A NumPy array gets a NumPy array of its dtype, an array.array one of its
+    typecode and a memoryview one over a new bytearray of its format, so
+    typed data is never boxed into a list of Python objects
+    Arguments:
+        input_list: A list, array.array, memoryview, NumPy array or any
+                    other mutable sequence
+        n: An integer which is the number of elements, defaults to the
+           length of input_list
+    Time complexity:
+        O(n), for zero filling.
+    Space complexity:
+        O(n) elements of the input's type, n pointers for anything else.
+    Return: A mutable sequence of n elements, with unspecified values
+    """
+
+    if n is None:
+        n = len(input_list)
+
+    if np is not None and isinstance(input_list, np.ndarray):
+        return np.empty(n, dtype=input_list.dtype)
+
+    if isinstance(input_list, array):
+        # A bytes initializer is read with frombytes, nothing is boxed
+        return array(input_list.typecode, bytes(n * input_list.itemsize))
+
+    if isinstance(input_list, memoryview):
+        try:
+            return memoryview(bytearray(n * input_list.itemsize)).cast(input_list.format)
+        except (TypeError, ValueError):
+            # Only native single character formats can be cast to
+            pass
+
+    return [None] * n
+
+
+def copy_of(input_list, start=0, end=None):
+    """
+    A function that copies input_list[start:end] into storage of the same
+    element type
+    Slicing a NumPy array or a memoryview gives a view of the same memory,
+    which would be overwritten while it is being merged from
+    Arguments:
+        input_list: A list, array.array, memoryview, NumPy array or any
+                    other mutable sequence
+        start: An integer which is the first index to copy
+        end: An integer which is one past the last index to copy, defaults
+             to the length of input_list
+    Time complexity:
+        O(end - start)
+    Space complexity:
+        O(end - start)
+    Return: A mutable sequence independent of input_list
+    """
+
+    if end is None:
+        end = len(input_list)
+
+    if np is not None and isinstance(input_list, np.ndarray):
+        return input_list[start:end].copy()
+
+    if isinstance(input_list, memoryview):
+        output_list = empty_like(input_list, end - start)
+        output_list[:] = input_list[start:end]
+        return output_list
+
+    # Slicing copies a list into a list and an array into an array of the same typecode
+    return input_list[start:end]
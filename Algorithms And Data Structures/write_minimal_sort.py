@@ -0,0 +1,167 @@
+"""
+Author:     Chan Guan Yu
+Algorithm:  Sorting
+Name:       Write-Minimal Sorts (Cycle Sort and Selection Sort)
+Stability:  Unstable
+"""
+
+
+import mmap
+import os
+from array import array
+from contextlib import contextmanager
+
+
+PAGE_SIZE = mmap.PAGESIZE
+
+
+def cycle_sort(input_list):
+    """
+    A function that performs cycle sort
+    Every element is written at most once, directly into its final position,
+    and elements already in place are never written
+    Arguments:
+        input_list: Any mutable sequence, including a memoryview over an mmap
+    Time complexity:
+        O(n**2), the final position of each element is found by counting the
+        smaller elements. Reads are traded for writes.
+    Space complexity:
+        O(1)
+    Return: An integer which is the number of element writes
+    """
+
+    n = len(input_list)
+    writes = 0
+
+    for cycle_start in range(n - 1):
+        item = input_list[cycle_start]
+
+        # Final position of item is after every smaller element
+        pos = cycle_start
+        for i in range(cycle_start + 1, n):
+            if input_list[i] < item:
+                pos = pos + 1
+
+        if pos == cycle_start:
+            continue
+
+        # Follow the cycle, each write puts one element in its final position
+        while pos != cycle_start:
+            while item == input_list[pos]:
+                pos = pos + 1
+            input_list[pos], item = item, input_list[pos]
+            writes = writes + 1
+
+            pos = cycle_start
+            for i in range(cycle_start + 1, n):
+                if input_list[i] < item:
+                    pos = pos + 1
+
+        input_list[cycle_start] = item
+        writes = writes + 1
+
+    return writes
+
+
+def selection_sort(input_list):
+    """
+    A function that performs selection sort, skipping swaps that would not
+    move anything
+    Arguments:
+        input_list: Any mutable sequence, including a memoryview over an mmap
+    Time complexity:
+        O(n**2)
+    Space complexity:
+        O(1)
+    Return: An integer which is the number of element writes, at most 2 * (n - 1)
+    """
+
+    n = len(input_list)
+    writes = 0
+
+    for i in range(n - 1):
+        min_index = i
+        for j in range(i + 1, n):
+            if input_list[j] < input_list[min_index]:
+                min_index = j
+
+        if min_index != i:
+            input_list[i], input_list[min_index] = input_list[min_index], input_list[i]
+            writes = writes + 2
+
+    return writes
+
+
+class WriteTracker:
+    """
+    A class which wraps a mutable sequence and records the writes made to it,
+    and the pages of the underlying buffer they dirty
+    Any in-place sort can run on it, so their page dirties can be compared
+    """
+
+    __slots__ = ("buffer", "items_per_page", "writes", "pages")
+
+    def __init__(self, buffer, item_size=8, page_size=PAGE_SIZE):
+        """
+        Initialization of instance variables
+        """
+
+        self.buffer = buffer
+        self.items_per_page = max(1, page_size // item_size)
+        self.writes = 0
+        self.pages = set()
+
+    def __len__(self):
+        return len(self.buffer)
+
+    def __getitem__(self, index):
+        return self.buffer[index]
+
+    def __setitem__(self, index, val):
+        self.writes = self.writes + 1
+        self.pages.add(index // self.items_per_page)
+        self.buffer[index] = val
+
+
+@contextmanager
+def mmap_buffer(path, typecode="q"):
+    """
+    A function that maps a file of fixed-width records into memory for
+    sorting in place
+    Arguments:
+        path: A string which is the path of the file
+        typecode: A string which is the array typecode of one record
+    Time complexity:
+        O(1), pages are read in on first access.
+    Space complexity:
+        O(1) in the Python heap.
+    Return: A context manager yielding a typed memoryview over the file,
+            writes go straight to the mapped pages. An empty file yields an
+            empty memoryview
+    """
+
+    item_size = array(typecode).itemsize
+    with open(path, "r+b") as file:
+        # An empty file cannot be mapped, but it is a valid, already sorted input
+        if os.fstat(file.fileno()).st_size == 0:
+            records = memoryview(bytearray()).cast(typecode)
+            try:
+                yield records
+            finally:
+                records.release()
+            return
+
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_WRITE)
+        view = memoryview(mapped)
+        try:
+            if len(view) % item_size != 0:
+                raise ValueError("File size is not a multiple of the record width")
+            records = view.cast(typecode)
+            try:
+                yield records
+            finally:
+                records.release()
+        finally:
+            view.release()
+            mapped.flush()
+            mapped.close()